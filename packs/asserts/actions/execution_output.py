@@ -0,0 +1,193 @@
+import json
+import os
+import sys
+
+import requests
+from six.moves.urllib.parse import urlencode
+
+from st2actions.runners.pythonrunner import Action
+from st2client.client import Client
+from st2common.constants.action import LIVEACTION_COMPLETED_STATES
+
+from lib.streaming import LineSplitter, StreamingMatcher
+
+__all__ = [
+    'AssertExecutionOutput'
+]
+
+OUTPUT_EVENTS = ['st2.execution__update', 'st2.execution.output__create']
+
+
+class AssertExecutionOutput(Action):
+    def run(self, execution_id, output_type=None, contains=None, not_contains=None, regex=None,
+            counts=None):
+        client = Client(base_url='http://localhost')
+        matcher = StreamingMatcher(contains=contains, not_contains=not_contains, regex=regex,
+                                   counts=counts)
+
+        execution = client.executions.get_by_id(execution_id)
+        if execution.status in LIVEACTION_COMPLETED_STATES:
+            failures = self._evaluate(matcher, self._get_stored_output(client, execution_id,
+                                                                       output_type))
+        else:
+            failures = self._evaluate_running(matcher, client, execution_id, output_type)
+
+        if failures:
+            message = '\n'.join('  %s' % (failure) for failure in failures)
+            sys.stderr.write('Output assertions failed after %d lines:\n%s\n' %
+                             (matcher.lines, message))
+            raise ValueError('Output assertions failed:\n%s' % (message))
+
+        sys.stdout.write('MATCHED (%d lines read).' % (matcher.lines))
+        return {'lines': matcher.lines}
+
+    def _evaluate(self, matcher, chunks):
+        splitter = LineSplitter()
+
+        for chunk in chunks:
+            for line in splitter.feed(chunk):
+                matcher.feed(line)
+
+            verdict = matcher.verdict()
+            if verdict is not None:
+                # Closing the generator stops reading the rest of the output
+                chunks.close()
+                return verdict
+
+        for line in splitter.flush():
+            matcher.feed(line)
+
+        return matcher.verdict(final=True)
+
+    def _get_auth_headers(self, client):
+        # Like the st2client managers, fall back to the credentials the runner puts in the
+        # environment
+        headers = {}
+        token = client.token or os.environ.get('ST2_AUTH_TOKEN')
+        api_key = client.api_key or os.environ.get('ST2_API_KEY')
+        if token:
+            headers['X-Auth-Token'] = token
+        if api_key:
+            headers['St2-Api-Key'] = api_key
+        return headers
+
+    def _get_stored_output(self, client, execution_id, output_type):
+        url = '%s/executions/%s/output' % (client.endpoints['api'], execution_id)
+        params = {'output_type': output_type} if output_type else {}
+
+        response = requests.get(url, params=params, headers=self._get_auth_headers(client),
+                                stream=True, verify=client.cacert or True)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024, decode_unicode=True):
+                yield chunk
+        finally:
+            response.close()
+
+    def _evaluate_running(self, matcher, client, execution_id, output_type):
+        """
+        Evaluate the output of a running execution: subscribe to the stream first and match the
+        live output records as they arrive. The output written before the subscription is
+        matched once the execution has finished, when the stored output holds every record and
+        the records received live are exactly its last ``live_length`` characters.
+
+        The first live line can continue a line written before the subscription, so it is held
+        back until the stored output before it has been matched.
+        """
+        response = self._subscribe(client)
+        try:
+            execution = client.executions.get_by_id(execution_id)
+            if execution.status in LIVEACTION_COMPLETED_STATES:
+                return self._evaluate(matcher, self._get_stored_output(client, execution_id,
+                                                                       output_type))
+
+            splitter = LineSplitter()
+            first_line = None
+            live_length = 0
+            for data in self._get_live_output(response, execution_id, output_type):
+                live_length += len(data)
+                for line in splitter.feed(data):
+                    if first_line is None:
+                        first_line = line
+                        continue
+                    matcher.feed(line)
+
+                verdict = matcher.verdict()
+                if verdict is not None:
+                    return verdict
+        finally:
+            response.close()
+
+        last_lines = list(splitter.flush())
+        if first_line is None and last_lines:
+            first_line = last_lines.pop()
+
+        # Count the stored output first, then only read it up to the live records
+        stored_length = sum(len(chunk) for chunk in
+                            self._get_stored_output(client, execution_id, output_type))
+        earlier = self._truncate(self._get_stored_output(client, execution_id, output_type),
+                                 stored_length - live_length)
+
+        earlier_splitter = LineSplitter()
+        for chunk in earlier:
+            for line in earlier_splitter.feed(chunk):
+                matcher.feed(line)
+
+            verdict = matcher.verdict()
+            if verdict is not None:
+                earlier.close()
+                return verdict
+
+        if first_line is not None:
+            # Completes the partial line the earlier output ends with
+            for line in earlier_splitter.feed(first_line + '\n'):
+                matcher.feed(line)
+        for line in list(earlier_splitter.flush()) + last_lines:
+            matcher.feed(line)
+
+        return matcher.verdict(final=True)
+
+    def _truncate(self, chunks, length):
+        try:
+            for chunk in chunks:
+                if length <= 0:
+                    return
+                yield chunk[:length]
+                length -= len(chunk)
+        finally:
+            chunks.close()
+
+    def _subscribe(self, client):
+        """
+        Open the event stream. The API server subscribes before it sends the response headers,
+        so every event after this returns is received.
+        """
+        url = '%s/stream?%s' % (client.endpoints['stream'],
+                                urlencode({'events': ','.join(OUTPUT_EVENTS)}))
+        response = requests.get(url, headers=self._get_auth_headers(client), stream=True,
+                                verify=client.cacert or True)
+        response.raise_for_status()
+        return response
+
+    def _get_live_output(self, response, execution_id, output_type):
+        from sseclient import SSEClient
+
+        for message in SSEClient(response).events():
+            if not message.data:
+                continue
+            event = json.loads(message.data)
+
+            if event.get('status', None) is not None:
+                if event.get('id') == execution_id and \
+                        event['status'] in LIVEACTION_COMPLETED_STATES:
+                    return
+                continue
+
+            if event.get('execution_id') != execution_id:
+                continue
+            if output_type and event.get('output_type') != output_type:
+                continue
+
+            yield event['data']
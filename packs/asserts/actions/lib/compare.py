@@ -0,0 +1,111 @@
+import itertools
+import re
+
+import six
+from six.moves import reprlib
+
+__all__ = [
+    'MAX_DIFFS',
+    'diff',
+    'format_diffs'
+]
+
+# Maximum number of differing paths reported for a single comparison
+MAX_DIFFS = 10
+
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+_REPR = reprlib.Repr()
+_REPR.maxstring = 80
+_REPR.maxother = 80
+_REPR.maxlist = 5
+_REPR.maxdict = 5
+_REPR.maxlevel = 2
+
+
+def _kind(value):
+    # bool is a subclass of int, so it needs to be checked first
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, six.integer_types + (float,)):
+        return 'number'
+    if isinstance(value, six.string_types):
+        return 'string'
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, (list, tuple)):
+        return 'array'
+    if value is None:
+        return 'null'
+    return type(value).__name__
+
+
+def _join(path, key):
+    if isinstance(key, six.integer_types):
+        return '%s[%d]' % (path, key)
+    if isinstance(key, six.string_types) and _IDENTIFIER_RE.match(key):
+        return '%s.%s' % (path, key) if path else key
+    return '%s[%r]' % (path, key)
+
+
+def _iter_diffs(actual, expected, path, contains):
+    actual_kind = _kind(actual)
+    expected_kind = _kind(expected)
+
+    if actual_kind != expected_kind:
+        yield '%s: expected %s %s, got %s %s' % (path or '<root>', expected_kind,
+                                                 _REPR.repr(expected), actual_kind,
+                                                 _REPR.repr(actual))
+        return
+
+    if expected_kind == 'object':
+        for key in expected:
+            key_path = _join(path, key)
+            if key not in actual:
+                yield '%s: missing key' % (key_path)
+                continue
+            for item in _iter_diffs(actual[key], expected[key], key_path, contains):
+                yield item
+
+        if not contains:
+            for key in actual:
+                if key not in expected:
+                    yield '%s: unexpected key' % (_join(path, key))
+        return
+
+    if expected_kind == 'array':
+        if len(actual) != len(expected):
+            yield '%s: expected %d items, got %d' % (path or '<root>', len(expected),
+                                                     len(actual))
+        for index, (actual_item, expected_item) in enumerate(zip(actual, expected)):
+            for item in _iter_diffs(actual_item, expected_item, _join(path, index), contains):
+                yield item
+        return
+
+    if actual != expected:
+        yield '%s: expected %s, got %s' % (path or '<root>', _REPR.repr(expected),
+                                           _REPR.repr(actual))
+
+
+def diff(actual, expected, contains=False, max_diffs=MAX_DIFFS):
+    """
+    Structurally compare two JSON-like objects.
+
+    Traversal is lazy and stops as soon as more than ``max_diffs`` differences have been found
+    so large objects which differ early are never fully walked.
+
+    :param contains: If True, ``actual`` may contain keys which are not in ``expected``.
+    :type contains: ``bool``
+
+    :return: Up to ``max_diffs + 1`` differences, the extra one tells ``format_diffs`` that
+             some differences were left out.
+    :rtype: ``list`` of ``str``
+    """
+    return list(itertools.islice(_iter_diffs(actual, expected, '', contains), max_diffs + 1))
+
+
+def format_diffs(diffs, max_diffs=MAX_DIFFS):
+    message = '\n'.join('  %s' % (item) for item in diffs[:max_diffs])
+    if len(diffs) > max_diffs:
+        message += '\n  (stopped after %d differences)' % (max_diffs)
+    return message
@@ -0,0 +1,68 @@
+from lib.compare import diff, format_diffs
+
+__all__ = [
+    'OPERATORS',
+    'evaluate'
+]
+
+
+def _equals(actual, expected):
+    diffs = diff(actual, expected)
+    if diffs:
+        return 'Values not equal:\n%s' % (format_diffs(diffs))
+
+
+def _contains(actual, expected):
+    diffs = diff(actual, expected, contains=True)
+    if diffs:
+        return 'Value does not contain expected values:\n%s' % (format_diffs(diffs))
+
+
+def _string_equals(actual, expected):
+    if actual != expected:
+        return 'Value not equal. Expected "%s", got "%s".' % (expected, actual)
+
+
+def _number_equals(actual, expected):
+    if int(actual) != int(expected):
+        return 'Value not equal. Expected "%s", got "%s".' % (expected, actual)
+
+
+def _greater(actual, expected):
+    if not actual > expected:
+        return '"%s" is not greater than "%s"' % (actual, expected)
+
+
+def _less(actual, expected):
+    if not actual < expected:
+        return '"%s" is not less than "%s"' % (actual, expected)
+
+
+def _in(actual, expected):
+    if expected not in actual:
+        return '"%s" not found in "%s"' % (expected, actual)
+
+
+# Every operator returns None on success and a failure message otherwise
+OPERATORS = {
+    'equals': _equals,
+    'contains': _contains,
+    'string_equals': _string_equals,
+    'number_equals': _number_equals,
+    'greater': _greater,
+    'less': _less,
+    'in': _in
+}
+
+
+def evaluate(operator, actual, expected):
+    """
+    Evaluate a single assertion.
+
+    :rtype: ``str`` or ``None``
+    """
+    if operator not in OPERATORS:
+        raise ValueError('Unknown operator "%s". Valid operators: %s' %
+                         (operator, ', '.join(sorted(OPERATORS.keys()))))
+
+    return OPERATORS[operator](actual, expected)
@@ -0,0 +1,90 @@
+import operator
+import re
+
+__all__ = [
+    'compile_path',
+    'get_value'
+]
+
+# Matches one path segment: ".name", "name", "[3]", "['name']" or '["name"]'
+_SEGMENT_RE = re.compile(r'''\.?([^.\[\]'"]+)|\[(-?\d+)\]|\[(['"])(.*?)\3\]''')
+
+# Compiled accessors, keyed by path string
+_ACCESSORS = {}
+
+
+def _digit_getter(name):
+    index = int(name)
+
+    def getter(value):
+        if isinstance(value, (list, tuple)):
+            return value[index]
+        return value[name]
+    return getter
+
+
+def _parse(path):
+    segments = []
+    position = 0
+
+    if path.startswith('$'):
+        position = 1
+
+    while position < len(path):
+        match = _SEGMENT_RE.match(path, position)
+        if not match or match.end() == position:
+            raise ValueError('Invalid path "%s" at position %d' % (path, position))
+
+        name, index, _, quoted = match.groups()
+        if index is not None:
+            segments.append(operator.itemgetter(int(index)))
+        elif quoted is not None:
+            segments.append(operator.itemgetter(quoted))
+        elif name.isdigit():
+            segments.append(_digit_getter(name))
+        else:
+            segments.append(operator.itemgetter(name))
+
+        position = match.end()
+
+    return segments
+
+
+def compile_path(path):
+    """
+    Compile a dot / JSONPath-style path (e.g. ``result.stdout[3].id`` or
+    ``$.result['some key']``) into an accessor function.
+
+    Accessors are cached by path string so every path is only parsed once per process.
+    """
+    accessor = _ACCESSORS.get(path, None)
+    if accessor:
+        return accessor
+
+    segments = tuple(_parse(path))
+
+    def accessor(value):
+        for segment in segments:
+            value = segment(value)
+        return value
+
+    _ACCESSORS[path] = accessor
+    return accessor
+
+
+def get_value(object, path):
+    """
+    Retrieve the value at ``path`` in ``object``.
+
+    Top level keys which literally match ``path`` take precedence so keys containing dots keep
+    working.
+
+    :raises KeyError: If the path doesn't exist in the object.
+    """
+    if isinstance(object, dict) and path in object:
+        return object[path]
+
+    try:
+        return compile_path(path)(object)
+    except (KeyError, IndexError, TypeError):
+        raise KeyError(path)
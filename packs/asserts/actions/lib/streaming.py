@@ -0,0 +1,105 @@
+import re
+
+__all__ = [
+    'LineSplitter',
+    'StreamingMatcher'
+]
+
+# Lines longer than this are matched in pieces so a single huge line can't exhaust memory
+MAX_LINE_LENGTH = 64 * 1024
+
+
+class LineSplitter(object):
+    """
+    Turn arbitrary chunks of output into complete lines, only keeping the trailing partial line
+    in memory.
+    """
+
+    def __init__(self, max_line_length=MAX_LINE_LENGTH):
+        self._max_line_length = max_line_length
+        self._partial = ''
+
+    def feed(self, chunk):
+        data = self._partial + chunk
+        lines = data.split('\n')
+        self._partial = lines.pop()
+
+        for line in lines:
+            yield line
+
+        while len(self._partial) > self._max_line_length:
+            yield self._partial[:self._max_line_length]
+            self._partial = self._partial[self._max_line_length:]
+
+    def flush(self):
+        if self._partial:
+            partial, self._partial = self._partial, ''
+            yield partial
+
+
+class StreamingMatcher(object):
+    """
+    Evaluate line based assertions incrementally.
+
+    Only the outstanding assertions and per pattern counters are kept in memory. ``verdict()``
+    returns ``None`` while the result still depends on output which hasn't been seen yet.
+    """
+
+    def __init__(self, contains=None, not_contains=None, regex=None, counts=None):
+        self._contains = set(contains or [])
+        self._not_contains = list(not_contains or [])
+        self._regex = dict((pattern, re.compile(pattern)) for pattern in regex or [])
+        self._counts = dict((pattern, (re.compile(pattern), int(count)))
+                            for pattern, count in (counts or {}).items())
+        self._seen = dict((pattern, 0) for pattern in self._counts)
+        self._failures = []
+        self.lines = 0
+
+    def feed(self, line):
+        self.lines += 1
+
+        if self._contains:
+            self._contains = set(item for item in self._contains if item not in line)
+
+        if self._regex:
+            self._regex = dict((pattern, compiled) for pattern, compiled in self._regex.items()
+                               if not compiled.search(line))
+
+        for item in self._not_contains:
+            if item in line:
+                self._failures.append('Unexpected "%s" found on line %d' % (item, self.lines))
+
+        for pattern, (compiled, count) in self._counts.items():
+            if compiled.search(line):
+                self._seen[pattern] += 1
+                if self._seen[pattern] == count + 1:
+                    self._failures.append('Pattern "%s" matched more than %d times' %
+                                          (pattern, count))
+
+    def verdict(self, final=False):
+        """
+        :param final: True once the whole output has been fed.
+
+        :return: ``None`` if undecided, otherwise a (possibly empty) list of failures.
+        :rtype: ``list`` or ``None``
+        """
+        if self._failures:
+            return self._failures
+
+        pending = self._not_contains or self._counts
+        if not final:
+            if self._contains or self._regex or pending:
+                return None
+            return []
+
+        failures = []
+        for item in sorted(self._contains):
+            failures.append('"%s" not found in output' % (item))
+        for pattern in sorted(self._regex):
+            failures.append('Pattern "%s" not matched in output' % (pattern))
+        for pattern, (_, count) in sorted(self._counts.items()):
+            if self._seen[pattern] != count:
+                failures.append('Pattern "%s" matched %d times, expected %d' %
+                                (pattern, self._seen[pattern], count))
+        return failures
+
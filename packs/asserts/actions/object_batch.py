@@ -0,0 +1,49 @@
+import sys
+
+from st2actions.runners.pythonrunner import Action
+
+from lib.operators import evaluate
+from lib.paths import get_value
+
+__all__ = [
+    'AssertObjectBatch'
+]
+
+
+class AssertObjectBatch(Action):
+    def run(self, object, assertions):
+        if not isinstance(object, dict):
+            raise ValueError('object shoud be of type "dict".')
+
+        results = []
+        for assertion in assertions:
+            key = assertion['key']
+            operator = assertion.get('operator', 'equals')
+            expected = assertion.get('value', None)
+
+            try:
+                message = evaluate(operator, get_value(object, key), expected)
+            except KeyError:
+                message = 'Key %s doesn\'t exist in object' % (key)
+            except (TypeError, ValueError) as e:
+                message = str(e)
+
+            results.append({
+                'key': key,
+                'operator': operator,
+                'value': expected,
+                'passed': message is None,
+                'message': message
+            })
+
+        failed = [result for result in results if not result['passed']]
+
+        for result in results:
+            sys.stdout.write('%-4s %s %s %r\n' % ('OK' if result['passed'] else 'FAIL',
+                                                  result['key'], result['operator'],
+                                                  result['value']))
+        for result in failed:
+            sys.stderr.write('%s: %s\n' % (result['key'], result['message']))
+
+        return (not failed, {'passed': len(results) - len(failed), 'failed': len(failed),
+                             'results': results})
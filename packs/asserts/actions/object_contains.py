@@ -1,29 +1,29 @@
-import pprint
 import sys
 
 from st2actions.runners.pythonrunner import Action
 
+from lib.compare import diff, format_diffs
+from lib.paths import get_value
+
 __all__ = [
     'AssertObjectContains'
 ]
 
 
 class AssertObjectContains(Action):
-    def run(self, object, expected):
-        for obj in expected:
-            input_obj = object[obj]
-            expected_obj = expected[obj]
-            for item in expected_obj:
-                if item not in input_obj:
-                    pprint.pprint('Key not found: %s' % item, stream=sys.stderr)
-                    raise ValueError('Objects not equal. Input: %s, Expected: %s.' %
-                                     (object, expected))
-                else:
-                    if expected_obj[item] != input_obj[item]:
-                        pprint.pprint('Input: \n%s:%s' % (item, input_obj[item]), stream=sys.stderr)
-                        pprint.pprint('Expected: \n%s:%s' % (item, expected_obj[item]),
-                                      stream=sys.stderr)
-                        raise ValueError('Objects not equal. Input: %s, Expected: %s.' %
-                                         (object, expected))
+    def run(self, object, expected, key=None):
+        if key:
+            try:
+                object = get_value(object, key)
+            except KeyError:
+                sys.stderr.write('KEY %s DOESN\'T EXIST.' % key)
+                raise ValueError('Key %s doesn\'t exist in object %s' % (key, object))
+
+        diffs = diff(object, expected, contains=True)
+
+        if diffs:
+            message = format_diffs(diffs)
+            sys.stderr.write('Differences:\n%s\n' % (message))
+            raise ValueError('Object does not contain expected values:\n%s' % (message))
 
         sys.stdout.write('EQUAL.')
@@ -1,28 +1,29 @@
-import pprint
 import sys
-import json
 
 from st2actions.runners.pythonrunner import Action
 
+from lib.compare import diff, format_diffs
+from lib.paths import get_value
+
 __all__ = [
     'AssertObjectEquals'
 ]
 
 
-def cmp(x, y):
-    x = json.dumps(x, sort_keys=True)
-    y = json.dumps(y, sort_keys=True)
-
-    return (x == y)
-
-
 class AssertObjectEquals(Action):
-    def run(self, object, expected):
-        ret = cmp(object, expected)
+    def run(self, object, expected, key=None):
+        if key:
+            try:
+                object = get_value(object, key)
+            except KeyError:
+                sys.stderr.write('KEY %s DOESN\'T EXIST.' % key)
+                raise ValueError('Key %s doesn\'t exist in object %s' % (key, object))
+
+        diffs = diff(object, expected)
 
-        if ret:
+        if not diffs:
             sys.stdout.write('EQUAL.')
         else:
-            pprint.pprint('Input: \n%s' % object, stream=sys.stderr)
-            pprint.pprint('Expected: \n%s' % expected, stream=sys.stderr)
-            raise ValueError('Objects not equal. Input: %s, Expected: %s.' % (object, expected))
+            message = format_diffs(diffs)
+            sys.stderr.write('Differences:\n%s\n' % (message))
+            raise ValueError('Objects not equal:\n%s' % (message))
@@ -2,6 +2,8 @@ import sys
 
 from st2actions.runners.pythonrunner import Action
 
+from lib.paths import get_value
+
 __all__ = [
     'AssertObjectKeyIntEquals'
 ]
@@ -11,14 +13,16 @@ class AssertObjectKeyIntEquals(Action):
     def run(self, object, key, value):
         if not isinstance(object, dict):
             raise ValueError('object shoud be of type "dict".')
-        if key not in object:
+        try:
+            actual = get_value(object, key)
+        except KeyError:
             sys.stderr.write('KEY %s DOESN\'T EXIST.' % key)
             raise ValueError('Key %s doesn\'t exist in object %s' % (key, object))
-        result = (int(object[key]) == int(value))
+        result = (int(actual) == int(value))
         if result:
             sys.stdout.write('EQUAL.')
         else:
             sys.stdout.write('NOT EQUAL.')
-            sys.stderr.write(' Expected: %s, Original: %s' % (value, object[key]))
-            raise ValueError('Value not equal. Expected "%s", got "%s". ' % (value, object[key]))
+            sys.stderr.write(' Expected: %s, Original: %s' % (value, actual))
+            raise ValueError('Value not equal. Expected "%s", got "%s". ' % (value, actual))
         return result
@@ -0,0 +1,191 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from multiprocessing.pool import ThreadPool
+
+from slackclient import SlackClient
+
+from lib.aliases import benchmark_alias, benchmark_command
+from lib.fake_slack import use_api_url
+from lib.router import SlackMessageRouter
+from lib.stats import summarize
+
+# Uses the same environment variables as test_aliases_with_slack.py:
+# SLACK_CHANNEL, SLACK_USER_API_TOKEN, SLACK_USER_USERNAME and optionally SLACK_API_URL.
+
+__all__ = [
+    'BenchmarkAliasesAction'
+]
+
+TOKEN_RE = re.compile(r'benchmsg-[0-9a-f]+-\d+')
+
+
+def _message_text(message):
+    parts = [message.get('text') or '']
+    for attachment in message.get('attachments') or []:
+        parts.extend([attachment.get('pretext') or '', attachment.get('text') or ''])
+    return '\n'.join(parts)
+
+
+def _token_or_channel(message):
+    match = TOKEN_RE.search(_message_text(message))
+    return match.group(0) if match else message.get('channel')
+
+
+class AliasBenchmark(object):
+    def __init__(self, st2_client, slack_client, channel, userid, timeout, quiet_period=2):
+        self.st2_client = st2_client
+        self.slack_client = slack_client
+        self.channel = channel
+        self.timeout = timeout
+        self.run_id = uuid.uuid4().hex[:8]
+        self.aliases = []
+
+        self.router = SlackMessageRouter(
+            slack_client,
+            lambda message: message.get('type') == 'message' and message.get('user') != userid,
+            timeout=timeout, quiet_period=quiet_period, key_func=_token_or_channel)
+
+    def start(self):
+        self.slack_client.rtm_connect()
+        self.router.start()
+
+        response = self.post("`===== BEGINNING ChatOps alias benchmark %s =====`" % (self.run_id))
+        self.channel_id = response['channel']
+
+    def stop(self):
+        self.router.stop()
+
+    def post(self, text):
+        return self.slack_client.api_call("chat.postMessage", channel=self.channel, text=text,
+                                          as_user=True)
+
+    def create_aliases(self, count):
+        from st2client.models import ActionAlias
+
+        manager = self.st2_client.managers['ActionAlias']
+        start_time = time.time()
+        for index in range(len(self.aliases), count):
+            self.aliases.append(manager.create(ActionAlias(**benchmark_alias(index))))
+        return time.time() - start_time
+
+    def delete_aliases(self):
+        manager = self.st2_client.managers['ActionAlias']
+        while self.aliases:
+            manager.delete(self.aliases.pop())
+
+    def measure_help(self):
+        subscription = self.router.subscribe(self.channel_id)
+        subscription.drain()
+
+        start_time = time.time()
+        self.post('!help')
+        first = subscription.wait_for_messages(1)
+        first_time = time.time() - start_time
+        # Help output can be split over several messages
+        rest = subscription.wait_for_messages(0, quiet_period=True)
+
+        return {
+            'first_message': first_time if first else None,
+            'messages': len(first) + len(rest)
+        }
+
+    def measure_commands(self, alias_count, commands, rate, concurrency):
+        ack_latencies = []
+        result_latencies = []
+        lock = threading.Lock()
+        start_time = time.time() + 0.1
+
+        def run_command(number):
+            token = 'benchmsg-%s-%d' % (self.run_id, number)
+            subscription = self.router.subscribe(token)
+
+            # Fire at the requested rate, independent of how long previous commands took
+            delay = start_time + float(number) / rate - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+            sent_at = time.time()
+            self.post(benchmark_command(number % alias_count, token))
+
+            # Wait for the ack and the result one at a time to time each of them
+            deadline = sent_at + self.timeout
+            for _ in range(2):
+                messages = subscription.wait_for_messages(1, timeout=deadline - time.time())
+                if not messages:
+                    break
+
+                latency = time.time() - sent_at
+                text = _message_text(messages[0])
+                with lock:
+                    if 'ack %s' % (token) in text:
+                        ack_latencies.append(latency)
+                    elif 'result' in text:
+                        result_latencies.append(latency)
+
+            self.router.unsubscribe(token)
+
+        pool = ThreadPool(concurrency)
+        pool.map(run_command, range(commands))
+        pool.close()
+        pool.join()
+
+        return {
+            'sent': commands,
+            'duration': time.time() - start_time,
+            'ack_latency': summarize(ack_latencies),
+            'result_latency': summarize(result_latencies)
+        }
+
+
+try:
+    from st2common.runners.base_action import Action
+    from st2client.client import Client
+
+    class BenchmarkAliasesAction(Action):
+        def run(self, alias_counts, commands, rate, concurrency, timeout, settle_time, cleanup):
+            slack_client = SlackClient(token=os.environ['SLACK_USER_API_TOKEN'])
+            if os.environ.get('SLACK_API_URL'):
+                use_api_url(slack_client, os.environ['SLACK_API_URL'])
+
+            username = os.environ['SLACK_USER_USERNAME']
+            userid = None
+            for user in slack_client.api_call("users.list").get('members'):
+                if user.get('real_name') == username:
+                    userid = user.get('id')
+
+            benchmark = AliasBenchmark(Client(base_url='http://localhost'), slack_client,
+                                       os.environ['SLACK_CHANNEL'], userid, timeout)
+            benchmark.start()
+
+            results = []
+            try:
+                for alias_count in sorted(alias_counts):
+                    sys.stdout.write('Benchmarking with %d aliases\n' % (alias_count))
+                    result = {
+                        'aliases': alias_count,
+                        'create_time': benchmark.create_aliases(alias_count)
+                    }
+
+                    # Give the bot time to pick up the new aliases
+                    time.sleep(settle_time)
+
+                    result['help'] = benchmark.measure_help()
+                    if commands:
+                        result['commands'] = benchmark.measure_commands(
+                            alias_count, commands, rate, concurrency)
+                    results.append(result)
+            finally:
+                if cleanup:
+                    benchmark.delete_aliases()
+                benchmark.stop()
+
+            return results
+
+except ImportError:
+    pass
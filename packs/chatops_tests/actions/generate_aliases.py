@@ -0,0 +1,103 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import os
+import shutil
+import sys
+import time
+
+from lib.aliases import write_alias_pack
+from lib.stats import summarize
+
+__all__ = [
+    'GenerateAliasesAction'
+]
+
+
+def measure_matches(client, commands, repeat):
+    """
+    Time alias match API calls for the sample commands.
+
+    :return: ``(latencies, failures)`` tuple.
+    """
+    from st2client.models import ActionAliasMatch
+
+    manager = client.managers['ActionAlias']
+    latencies = []
+    failures = []
+    for _ in range(repeat):
+        for command in commands:
+            start_time = time.time()
+            try:
+                manager.match(ActionAliasMatch(command=command))
+            except Exception as e:
+                failures.append('%s: %s' % (command, e))
+                continue
+            latencies.append(time.time() - start_time)
+
+    return latencies, failures
+
+
+def delete_aliases(client, pack):
+    manager = client.managers['ActionAlias']
+    for alias in manager.query(pack=pack):
+        manager.delete(alias)
+
+
+try:
+    from st2common.runners.base_action import Action
+    from st2client.client import Client
+
+    class GenerateAliasesAction(Action):
+        def run(self, alias_counts, pack, packs_path, match_repeat, cleanup):
+            client = Client(base_url='http://localhost')
+            pack_path = os.path.join(packs_path, pack)
+
+            results = []
+            try:
+                for alias_count in sorted(alias_counts):
+                    sys.stdout.write('Registering %d generated aliases\n' % (alias_count))
+                    start_time = time.time()
+                    commands = write_alias_pack(pack_path, pack, alias_count)
+                    write_time = time.time() - start_time
+
+                    start_time = time.time()
+                    client.packs.register(packs=[pack], types=['alias'])
+                    register_time = time.time() - start_time
+
+                    latencies, failures = measure_matches(client, commands, match_repeat)
+                    results.append({
+                        'aliases': alias_count,
+                        'write_time': write_time,
+                        'register_time': register_time,
+                        'register_time_per_alias': register_time / alias_count,
+                        'match_latency': summarize(latencies),
+                        'match_failures': failures
+                    })
+            finally:
+                if cleanup:
+                    delete_aliases(client, pack)
+                    shutil.rmtree(pack_path, ignore_errors=True)
+
+            # Per alias registration time should stay flat, if it grows with the alias count
+            # registration (or matching) is quadratic.
+            return results
+
+except ImportError:
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a pack with generated aliases')
+    parser.add_argument('--count', type=int, default=1000, help='Number of aliases')
+    parser.add_argument('--pack', default='chatops_generated', help='Pack name')
+    parser.add_argument('--path', default=None,
+                        help='Pack directory (defaults to the pack name)')
+    args = parser.parse_args()
+
+    for command in write_alias_pack(args.path or args.pack, args.pack, args.count):
+        print(command)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+
+import yaml
+
+__all__ = [
+    'BENCHMARK_PREFIX',
+    'GENERATED_PREFIX',
+    'benchmark_alias',
+    'benchmark_command',
+    'generate_alias',
+    'write_alias_pack'
+]
+
+BENCHMARK_PREFIX = 'bench'
+GENERATED_PREFIX = 'gen'
+
+
+def benchmark_alias(index, pack='chatops_tests'):
+    """
+    Synthetic alias in the style of ``aliases/unused_N.yaml``.
+
+    Ack and result formats echo the message back, so replies can be matched to the command
+    which triggered them even when many commands are in flight in the same channel.
+    """
+    return {
+        'name': '%s_%d' % (BENCHMARK_PREFIX, index),
+        'pack': pack,
+        'action_ref': 'core.echo',
+        'description': 'Alias matching benchmark.',
+        'formats': ['%s %d {{ message }}' % (BENCHMARK_PREFIX, index)],
+        'ack': {
+            'enabled': True,
+            'append_url': False,
+            'format': 'ack {{ execution.parameters.message }}'
+        },
+        'result': {
+            'format': 'result {{ execution.result.stdout }}'
+        }
+    }
+
+
+def benchmark_command(index, message):
+    return '!%s %d %s' % (BENCHMARK_PREFIX, index, message)
+
+
+# Templates modelled after the hand written aliases in this pack. Every template returns the
+# alias fields and a command which should match the alias.
+
+def _simple(keyword):
+    return {
+        'action_ref': 'core.remote',
+        'description': 'Generated alias - simple format.',
+        'formats': ['%s run {{cmd}} on {{hosts}}' % (keyword)]
+    }, '%s run "date" on localhost' % (keyword)
+
+
+def _default_parameter(keyword):
+    return {
+        'action_ref': 'core.local',
+        'description': 'Generated alias - default parameter value.',
+        'formats': ['%s local {{cmd=date}}' % (keyword)]
+    }, '%s local' % (keyword)
+
+
+def _regex_and_default_parameter(keyword):
+    return {
+        'action_ref': 'core.remote',
+        'description': 'Generated alias - regex and default parameter value.',
+        'formats': ['%s (run|execute) {{cmd}}( on {{hosts=localhost}})?[!.]?' % (keyword)]
+    }, '%s execute "uptime"!' % (keyword)
+
+
+def _multiple_formats(keyword):
+    return {
+        'action_ref': 'core.remote',
+        'description': 'Generated alias - multiple formats and representations.',
+        'formats': [
+            {
+                'display': '%s run remote command {{cmd}} on {{hosts}}' % (keyword),
+                'representation': [
+                    '%s run remote command {{cmd}} on {{hosts}}' % (keyword),
+                    '%s (run|execute-remote) {{cmd}}( on {{hosts=localhost}})?[!.]?' % (keyword)
+                ]
+            },
+            '%s ssh to hosts {{hosts}} and run command {{cmd}}' % (keyword)
+        ]
+    }, '%s ssh to hosts localhost and run command "date"' % (keyword)
+
+
+def _extra_parameters(keyword):
+    return {
+        'action_ref': 'core.remote',
+        'description': 'Generated alias - extra parameters.',
+        'formats': ['%s extra run {{cmd}} on {{hosts}}' % (keyword)]
+    }, '%s extra run "date" on localhost timeout=30' % (keyword)
+
+
+def _custom_ack_and_result(keyword):
+    return {
+        'action_ref': 'core.noop',
+        'description': 'Generated alias - custom ack and result with Slack attachment.',
+        'formats': ['%s say {{phrase}} in {{color}}' % (keyword)],
+        'ack': {
+            'enabled': True,
+            'append_url': False,
+            'format': 'Saying it for you'
+        },
+        'result': {
+            'format': 'said! {~} {{ execution.parameters.phrase }}',
+            'extra': {
+                'slack': {
+                    'color': '{{ execution.parameters.color }}'
+                }
+            }
+        }
+    }, '%s say Hello in #88CCEE' % (keyword)
+
+
+TEMPLATES = [
+    _simple,
+    _default_parameter,
+    _regex_and_default_parameter,
+    _multiple_formats,
+    _extra_parameters,
+    _custom_ack_and_result
+]
+
+
+def generate_alias(index, pack='chatops_tests'):
+    """
+    Generate an alias which cycles through the format styles used in this pack.
+
+    Every alias gets its own leading keyword so commands match exactly one alias.
+
+    :return: ``(alias, sample_command)`` tuple.
+    """
+    keyword = '%s%d' % (GENERATED_PREFIX, index)
+    alias, command = TEMPLATES[index % len(TEMPLATES)](keyword)
+    alias.update({
+        'name': '%s_%d' % (GENERATED_PREFIX, index),
+        'pack': pack
+    })
+    return alias, command
+
+
+def write_alias_pack(path, pack, count):
+    """
+    Write a pack with ``count`` generated aliases to ``path``.
+
+    :return: Sample command for every template.
+    :rtype: ``list``
+    """
+    aliases_path = os.path.join(path, 'aliases')
+    if not os.path.isdir(aliases_path):
+        os.makedirs(aliases_path)
+
+    with open(os.path.join(path, 'pack.yaml'), 'w') as fp:
+        yaml.safe_dump({
+            'ref': pack,
+            'name': pack,
+            'description': 'Generated aliases for alias matching and registration benchmarks.',
+            'version': '0.0.0',
+            'author': 'stanley',
+            'email': 'stanley@localhost.local'
+        }, fp, default_flow_style=False)
+
+    commands = []
+    for index in range(count):
+        alias, command = generate_alias(index, pack=pack)
+        if index < len(TEMPLATES):
+            commands.append(command)
+
+        with open(os.path.join(aliases_path, '%s.yaml' % (alias['name'])), 'w') as fp:
+            yaml.safe_dump(alias, fp, default_flow_style=False)
+
+    return commands
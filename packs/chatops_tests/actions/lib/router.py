@@ -0,0 +1,131 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+import time
+
+from six.moves import queue
+
+from lib.waiter import wait_for_rtm_data
+
+__all__ = [
+    'SlackMessageRouter'
+]
+
+# How long the reader thread blocks on the socket before checking whether it should stop
+READ_INTERVAL = 0.5
+
+
+class ChannelSubscription(object):
+    """
+    Messages dispatched under a single key (by default a channel).
+
+    Exposes the same interface as ``SlackMessageWaiter`` so tests don't need to know whether
+    they share the RTM stream with other tests.
+    """
+
+    def __init__(self, router, key):
+        self.router = router
+        self.key = key
+        self.messages = queue.Queue()
+
+    def wait_for_messages(self, count, predicate=None, timeout=None, quiet_period=None):
+        timeout = self.router.timeout if timeout is None else timeout
+        if quiet_period is True:
+            quiet_period = self.router.quiet_period
+
+        messages = []
+        self._get_until(messages, count, predicate, time.time() + timeout)
+
+        if quiet_period and len(messages) >= count:
+            self._get_until(messages, None, predicate, time.time() + quiet_period)
+
+        return messages
+
+    def drain(self):
+        while True:
+            try:
+                self.messages.get_nowait()
+            except queue.Empty:
+                return
+
+    def _get_until(self, messages, count, predicate, deadline):
+        while count is None or len(messages) < count:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+
+            try:
+                message = self.messages.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            if predicate and not predicate(message):
+                continue
+            messages.append(message)
+
+
+class SlackMessageRouter(object):
+    """
+    Read the RTM stream in a background thread and dispatch every message to the subscription
+    of the channel it was posted in.
+
+    Tests running concurrently each own a channel, so the channel acts as the correlation key
+    between a test and the bot replies to it. Alias commands can't carry an extra correlation
+    token since that would change what they match.
+
+    Messages under a key nobody subscribed to (e.g. replies to a test which already
+    unsubscribed) are dropped, so subscribe before posting the message the replies are expected
+    to.
+
+    :param key_func: Function returning the key to dispatch a message by, or ``None`` to drop
+                     the message. Defaults to the message channel.
+    """
+
+    def __init__(self, client, message_filter, timeout, quiet_period, key_func=None):
+        self.client = client
+        self.message_filter = message_filter
+        self.key_func = key_func or (lambda message: message.get('channel'))
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def subscribe(self, key):
+        with self._lock:
+            if key not in self._subscriptions:
+                self._subscriptions[key] = ChannelSubscription(self, key)
+            return self._subscriptions[key]
+
+    def unsubscribe(self, key):
+        with self._lock:
+            self._subscriptions.pop(key, None)
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._read_messages)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _read_messages(self):
+        while not self._stopped.is_set():
+            if not wait_for_rtm_data(self.client, READ_INTERVAL):
+                continue
+
+            for message in self.client.rtm_read():
+                if not self.message_filter(message):
+                    continue
+
+                key = self.key_func(message)
+                with self._lock:
+                    subscription = self._subscriptions.get(key)
+                if subscription is not None:
+                    subscription.messages.put(message)
@@ -0,0 +1,40 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import math
+
+__all__ = [
+    'percentile',
+    'summarize'
+]
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return None
+
+    index = max(0, int(math.ceil(percent / 100.0 * len(values))) - 1)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(values):
+    """
+    Summarize a list of latencies (in seconds) into count, min, max, mean and percentiles.
+
+    :rtype: ``dict``
+    """
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+
+    return {
+        'count': len(values),
+        'min': values[0],
+        'max': values[-1],
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99)
+    }
@@ -0,0 +1,100 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import select
+import time
+
+__all__ = [
+    'SlackMessageWaiter',
+    'wait_for_rtm_data'
+]
+
+# Used when the RTM websocket isn't available to block on
+FALLBACK_POLL_INTERVAL = 0.1
+
+
+class SlackMessageWaiter(object):
+    """
+    Wait for messages on the Slack RTM stream.
+
+    Instead of sleeping between reads, this blocks on the RTM websocket until data arrives or
+    the deadline passes, so waiting ends as soon as the expected messages have been received.
+    """
+
+    def __init__(self, client, message_filter, timeout, quiet_period):
+        self.client = client
+        self.message_filter = message_filter
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+
+    def wait_for_messages(self, count, predicate=None, timeout=None, quiet_period=None):
+        """
+        Wait until ``count`` messages matching the filter (and ``predicate`` if given) have been
+        received or ``timeout`` seconds have passed.
+
+        :param quiet_period: If set, keep listening for this many seconds after ``count``
+                             messages have been received and also return any extra messages.
+                             Used by tests which verify that the bot does *not* respond.
+                             ``True`` means the default quiet period.
+
+        :rtype: ``list``
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if quiet_period is True:
+            quiet_period = self.quiet_period
+
+        messages = []
+        self._read_until(messages, count, predicate, time.time() + timeout)
+
+        if quiet_period and len(messages) >= count:
+            self._read_until(messages, None, predicate, time.time() + quiet_period)
+
+        return messages
+
+    def _read_until(self, messages, count, predicate, deadline):
+        while count is None or len(messages) < count:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+
+            if not self._wait_for_data(remaining):
+                continue
+
+            for message in self.client.rtm_read():
+                if not self.message_filter(message):
+                    continue
+                if predicate and not predicate(message):
+                    continue
+                messages.append(message)
+
+    def drain(self):
+        """
+        Read and discard everything which is currently buffered on the RTM stream.
+        """
+        while self._wait_for_data(0):
+            if not self.client.rtm_read():
+                break
+
+    def _wait_for_data(self, timeout):
+        return wait_for_rtm_data(self.client, timeout)
+
+
+def wait_for_rtm_data(client, timeout):
+    """
+    Block until the RTM websocket of ``client`` is readable or ``timeout`` seconds have passed.
+
+    slackclient only reads a single frame per ``rtm_read()`` call and fails on plain (non SSL)
+    sockets which have no data, so reads should only happen once this returns True.
+    """
+    websocket = getattr(client.server, 'websocket', None)
+    sock = getattr(websocket, 'sock', None)
+
+    if sock is None:
+        time.sleep(min(timeout, FALLBACK_POLL_INTERVAL))
+        return True
+
+    # SSL sockets can hold already decrypted data which select() doesn't know about
+    if hasattr(sock, 'pending') and sock.pending():
+        return True
+
+    readable, _, _ = select.select([sock], [], [], timeout)
+    return bool(readable)
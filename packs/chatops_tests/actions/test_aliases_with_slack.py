@@ -1,12 +1,19 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import os
+import sys
+import threading
 import time
+from multiprocessing.pool import ThreadPool
 
 import unittest2
+from six.moves import queue
 
 from slackclient import SlackClient
 
+from lib.fake_slack import use_api_url
+from lib.router import SlackMessageRouter
+
 
 # REQUIRED environment variables:
 # * WEBSOCKET_CLIENT_CA_BUNDLE
@@ -36,6 +43,19 @@ from slackclient import SlackClient
 #   - Used to timeout while waiting for responses, and used to wait long enough
 #     to assume a non-response for tests that don't expect responses
 #   - Default: 120
+# * SLACK_QUIET_PERIOD
+#   - Number of seconds to keep listening after the expected messages have been
+#     received, for tests which verify the bot does _not_ respond
+#   - Default: 15
+# * SLACK_API_URL
+#   - Base URL of the Slack Web API, for example http://127.0.0.1:8765/api/ to
+#     run against the local fake Slack server in lib/fake_slack.py
+#   - Default: https://slack.com/api/
+# * SLACK_CHANNELS
+#   - Comma separated list of additional channels to run tests in. Every test
+#     owns a channel while it runs, so the number of channels limits how many
+#     tests can run concurrently (see the "parallelism" action parameter)
+#   - Default: only SLACK_CHANNEL
 
 
 
@@ -59,6 +79,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.WAIT_FOR_MESSAGES_TIMEOUT = int(os.environ.get('SLACK_WAIT_FOR_MESSAGES_TIMEOUT', 120))
+        cls.QUIET_PERIOD = int(os.environ.get('SLACK_QUIET_PERIOD', 15))
 
         cls.SLACK_CHANNEL = os.environ['SLACK_CHANNEL']
         cls.SLACK_BOT_USERNAME = os.environ['SLACK_BOT_USERNAME']
@@ -67,28 +88,56 @@ class SlackEndToEndTestCase(unittest2.TestCase):
 
         # This token is for the bot that impersonates a user
         cls.client = SlackClient(connect=True, token=cls.SLACK_USER_API_TOKEN)
+        if os.environ.get('SLACK_API_URL'):
+            use_api_url(cls.client, os.environ['SLACK_API_URL'])
         cls.channel = cls.SLACK_CHANNEL
         cls.bot_username = cls.SLACK_BOT_USERNAME
         cls.username = cls.SLACK_USER_USERNAME
         cls.userid = cls.get_user_id(cls.username)
-        cls.filter = staticmethod(ignore_username(cls.userid))
-
-        cls.client.api_call(
-            "chat.postMessage",
-            channel=cls.channel,
-            text="`===== BEGINNING ChatOps End-to-End Tests =====`",
-            as_user=True)
+        cls.router = SlackMessageRouter(cls.client, ignore_username(cls.userid),
+                                        timeout=cls.WAIT_FOR_MESSAGES_TIMEOUT,
+                                        quiet_period=cls.QUIET_PERIOD)
+
+        extra_channels = os.environ.get('SLACK_CHANNELS', '')
+        channel_names = [cls.channel] + [name.strip() for name in extra_channels.split(',')
+                                         if name.strip() and name.strip() != cls.channel]
+
+        # Channel ids are needed to route messages received over RTM
+        cls.channel_ids = {}
+        cls.channels = queue.Queue()
+        for name in channel_names:
+            response = cls.client.api_call(
+                "chat.postMessage",
+                channel=name,
+                text="`===== BEGINNING ChatOps End-to-End Tests =====`",
+                as_user=True)
+            cls.channel_ids[name] = response['channel']
+            cls.channels.put(name)
 
         # Connect as the bot
         cls.client.rtm_connect()
+        cls.router.start()
 
     @classmethod
     def tearDownClass(cls):
-        cls.client.api_call(
-            "chat.postMessage",
-            channel=cls.channel,
-            text="`===== FINISHED ChatOps End-to-End Tests =====`",
-            as_user=True)
+        cls.router.stop()
+
+        for name in cls.channel_ids:
+            cls.client.api_call(
+                "chat.postMessage",
+                channel=name,
+                text="`===== FINISHED ChatOps End-to-End Tests =====`",
+                as_user=True)
+
+    def setUp(self):
+        # Own a channel for the duration of the test, so replies can be told apart from the
+        # replies to tests running concurrently
+        self.channel = self.channels.get()
+        self.waiter = self.router.subscribe(self.channel_ids[self.channel])
+        self.waiter.drain()
+
+    def tearDown(self):
+        self.channels.put(self.channel)
 
     @classmethod
     def get_user_id(cls, username):
@@ -103,26 +152,13 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="This message should not prompt a response from the bot",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        # Listen for the quiet period to make sure the bot does _not_ respond
+        messages = self.waiter.wait_for_messages(0, quiet_period=True)
 
         self.assertListEqual(messages, [])
 
-        if len(messages) != 0:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
-
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_help_shortcut(self):
         post_message_response = self.client.api_call(
@@ -131,22 +167,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!help",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Help commands for 'unused' action alias should returns 105.
         combined_text = messages[0]['text'] + "\n" + messages[1]['text']
@@ -155,7 +178,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertEqual(number_of_unused_commands, 105)
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_help_longcut(self):
         post_message_response = self.client.api_call(
@@ -165,22 +188,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             as_user=True,
             link_names=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Help commands for 'unused' action alias should returns 105
         combined_text = messages[0]['text'] + "\n" + messages[1]['text']
@@ -189,7 +199,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertEqual(number_of_unused_commands, 105)
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_command_on_localhost(self):
         post_message_response = self.client.api_call(
@@ -198,22 +208,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!remote run date on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -243,7 +240,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'stdout\s*:\s*')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_command_on_localhost_with_bad_argument(self):
         post_message_response = self.client.api_call(
@@ -252,22 +249,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!pack get pack=example",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 1:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(1)
 
         self.assertEqual(1, len(messages))
-        if len(messages) != 1:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for response
         self.assertIsNotNone(messages[0].get('bot_id'))
@@ -286,7 +270,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r"Command \"pack get pack=example\" doesn't match format string \"pack get \{\{ pack \}\}\"")
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_exact_command_on_localhost(self):
         post_message_response = self.client.api_call(
@@ -295,22 +279,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!remote run \"echo ChatOps run exact command on localhost\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -341,7 +312,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'stdout\s*:\s*ChatOps run exact command on localhost')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_exact_command_on_multiple_hosts(self):
         post_message_response = self.client.api_call(
@@ -350,22 +321,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!remote run \"echo ChatOps run exact command on multiple hosts\" on localhost,127.0.0.1",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -395,7 +353,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'127.0.0.1\s*:\s*\n\s*stdout\s*:\s*ChatOps run exact command on multiple hosts')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_command_on_default_hosts(self):
         post_message_response = self.client.api_call(
@@ -404,22 +362,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!default run \"echo ChatOps run command on default hosts\"",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -445,7 +390,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_command_with_regex_and_default_parameter(self):
         post_message_response = self.client.api_call(
@@ -454,22 +399,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!regex run \"echo ChatOps run command with regex\".",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -495,7 +427,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_execute_command_with_regex_and_default_parameter(self):
         post_message_response = self.client.api_call(
@@ -504,22 +436,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!regex execute \"echo ChatOps execute command on default hosts\"!",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -545,7 +464,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_run_command_with_extra_parameter(self):
         post_message_response = self.client.api_call(
@@ -554,22 +473,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!extra run \"echo ChatOps run command with extra parameter\" on localhost timeout=120",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -595,7 +501,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_weird_run_remote_command_with_parameter(self):
         post_message_response = self.client.api_call(
@@ -604,22 +510,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!weird run remote command \"echo ChatOps run weird command\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -645,7 +538,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_weird_run_remote_command_with_ssh(self):
         post_message_response = self.client.api_call(
@@ -654,22 +547,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!weird ssh to hosts localhost and run command \"echo ChatOps run weird command with SSH\"",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -695,7 +575,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_weird_omg_just_run_command(self):
         post_message_response = self.client.api_call(
@@ -704,22 +584,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!weird OMG st2 just run this command \"echo ChatOps run weird OMG command\" on ma boxes localhost already",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -745,7 +612,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_custom_ack(self):
         post_message_response = self.client.api_call(
@@ -754,29 +621,16 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!custom-ack run \"echo ChatOps run command with custom ack\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for response
         self.assertIsNotNone(messages[0].get('bot_id'))
         self.assertEqual(messages[0].get('text'), 'Running the command(s) for you')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_disabled_ack(self):
         post_message_response = self.client.api_call(
@@ -785,22 +639,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!disabled-custom-ack run \"echo ChatOps run command with disabled ack\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 1:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(1)
 
         self.assertEqual(1, len(messages))
-        if len(messages) != 1:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for response
         self.assertIsNotNone(messages[0].get('bot_id'))
@@ -823,7 +664,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'Took \d+.*s to complete\.')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_disabled_ack_with_bad_command(self):
         post_message_response = self.client.api_call(
@@ -832,22 +673,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!disabled-custom-ack run \"echof ChatOps run bad command\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 1:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(1)
 
         self.assertEqual(1, len(messages))
-        if len(messages) != 1:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for response
         self.assertIsNotNone(messages[0].get('bot_id'))
@@ -872,7 +700,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertRegex(msg_text, r'return_code\s*:\s*\d+')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_alias_with_custom_result_format(self):
         post_message_response = self.client.api_call(
@@ -881,22 +709,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!custom-format run \"echo ChatOps run command with custom result format\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -925,7 +740,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertEqual(msg_text, expected_text)
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_alias_with_custom_result_format_and_multiple_hosts(self):
         post_message_response = self.client.api_call(
@@ -934,22 +749,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!custom-format run \"echo ChatOps run command with custom result format on multiple hosts\" on localhost,127.0.0.1",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -983,7 +785,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertIn(expected_localhost, msg_text)
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_alias_with_disabled_result(self):
         post_message_response = self.client.api_call(
@@ -992,30 +794,17 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!disabled-result run \"echo ChatOps run command with disabled result\" on localhost",
             as_user=True)
 
-        messages = []
-        # Wait for longer here since we want to test that it does _not_
+        # Keep listening for the quiet period since we want to test that it does _not_
         # emit a result
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(1, quiet_period=True)
 
         self.assertEqual(1, len(messages))
-        if len(messages) != 1:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_attachment_and_plaintext_backup(self):
         post_message_response = self.client.api_call(
@@ -1024,22 +813,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!plaintext-and-attachment run \"echo ChatOps run exact command with custom result format with plaintext and attachment\" on localhost",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -1058,7 +834,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
                          messages[1]['attachments'][0]['text'])
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_fields_parameter(self):
         post_message_response = self.client.api_call(
@@ -1067,22 +843,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!kitten pic",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -1119,7 +882,7 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertEqual(messages[1]['attachments'][0]['color'], '00AA00')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
 
     def test_jinja_input_parameters(self):
         post_message_response = self.client.api_call(
@@ -1128,22 +891,9 @@ class SlackEndToEndTestCase(unittest2.TestCase):
             text="!say Hello in #88CCEE",
             as_user=True)
 
-        messages = []
-        for i in range(self.WAIT_FOR_MESSAGES_TIMEOUT):
-            if len(messages) >= 2:
-                break
-            time.sleep(1)
-
-            all_messages = self.client.rtm_read()
-
-            filtered_messages = filter(self.filter, all_messages)
-
-            if filtered_messages:
-                messages.extend(filtered_messages)
+        messages = self.waiter.wait_for_messages(2)
 
         self.assertEqual(2, len(messages))
-        if len(messages) != 2:
-            time.sleep(self.WAIT_FOR_MESSAGES_TIMEOUT)
 
         # Test for ack
         self.assertIn("details available at", messages[0]['text'])
@@ -1175,14 +925,54 @@ class SlackEndToEndTestCase(unittest2.TestCase):
         self.assertEqual(messages[1]['attachments'][0]['color'], '88CCEE')
 
         # Drain the event buffer
-        self.client.rtm_read()
+        self.waiter.drain()
+
+
+def run_tests_concurrently(test_case, parallelism):
+    """
+    Run the tests of ``test_case`` in a pool of ``parallelism`` threads.
+    """
+    tests = list(unittest2.TestLoader().loadTestsFromTestCase(test_case))
+    result = unittest2.TextTestRunner()._makeResult()
+    lock = threading.Lock()
+
+    def run_test(test):
+        test_result = unittest2.TestResult()
+        test(test_result)
+
+        with lock:
+            result.testsRun += test_result.testsRun
+            result.failures.extend(test_result.failures)
+            result.errors.extend(test_result.errors)
+            result.skipped.extend(test_result.skipped)
+            result.expectedFailures.extend(test_result.expectedFailures)
+            result.unexpectedSuccesses.extend(test_result.unexpectedSuccesses)
+
+    start_time = time.time()
+    test_case.setUpClass()
+    try:
+        pool = ThreadPool(parallelism)
+        pool.map(run_test, tests)
+        pool.close()
+        pool.join()
+    finally:
+        test_case.tearDownClass()
+
+    result.printErrors()
+    sys.stderr.write('Ran %d tests in %.3fs with parallelism %d\n' %
+                     (result.testsRun, time.time() - start_time, parallelism))
+    sys.stderr.write('%s\n' % ('OK' if result.wasSuccessful() else 'FAILED'))
+    return result
 
 
 try:
     from st2common.runners.base_action import Action
 
     class SlackEndToEndTestAction(Action):
-        def run(self, *args, **kwargs):
+        def run(self, parallelism=1, *args, **kwargs):
+            if parallelism > 1:
+                return run_tests_concurrently(SlackEndToEndTestCase, parallelism)
+
             suite = unittest2.TestLoader().loadTestsFromTestCase(SlackEndToEndTestCase)
             return unittest2.TextTestRunner().run(suite)
 
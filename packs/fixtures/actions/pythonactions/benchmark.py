@@ -0,0 +1,72 @@
+from __future__ import division
+
+import math
+import time
+from multiprocessing.pool import ThreadPool
+
+__all__ = [
+    'run_concurrently',
+    'summarize',
+    'timed'
+]
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return None
+
+    index = max(0, int(math.ceil(percent / 100.0 * len(values))) - 1)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(latencies, elapsed):
+    """
+    Throughput and latency percentiles of operations which took ``elapsed`` seconds in total.
+    """
+    latencies = sorted(latencies)
+    if not latencies:
+        return {'count': 0}
+
+    return {
+        'count': len(latencies),
+        'ops_per_sec': len(latencies) / elapsed if elapsed else None,
+        'mean': sum(latencies) / len(latencies),
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'max': latencies[-1]
+    }
+
+
+def run_concurrently(operation, items, concurrency):
+    """
+    Call ``operation`` for every item from ``concurrency`` threads and time every call.
+
+    :return: Summary of the calls, see ``summarize``.
+    """
+    def timed(item):
+        start_time = time.time()
+        operation(item)
+        return time.time() - start_time
+
+    pool = ThreadPool(concurrency)
+    start_time = time.time()
+    try:
+        latencies = pool.map(timed, items)
+    finally:
+        pool.close()
+        pool.join()
+
+    return summarize(latencies, time.time() - start_time)
+
+
+def timed(function, *args, **kwargs):
+    """
+    :return: ``(result, elapsed)`` tuple.
+    """
+    start_time = time.time()
+    result = function(*args, **kwargs)
+    return result, time.time() - start_time
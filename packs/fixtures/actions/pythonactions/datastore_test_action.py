@@ -1,9 +1,13 @@
 import os
 import json
+import subprocess
+import tempfile
+import uuid
 
 # This is to test imports within actions folder to check
 # if we messed up sys.path for actions.
 from base import DummyClass
+from benchmark import run_concurrently, timed
 
 from st2actions.runners.pythonrunner import Action
 from st2client.client import Client
@@ -17,13 +21,151 @@ __all__ = [
 
 class DatastoreTestAction(Action):
 
-    def run(self):
+    def run(self, benchmark=False, operations=1000, value_sizes=None, concurrency=None,
+            encrypt=None, interfaces=None, bulk_benchmark=False, bulk_keys=1000):
         t_cls = DummyClass()
         print('Tests begin: %s' % t_cls.now())
         self._test_datastore_actions_via_client()
         self._test_datastore_actions_via_action_service()
         print('Tests end: %s' % t_cls.now())
 
+        results = {}
+        if benchmark:
+            results['benchmark'] = self._benchmark(operations, value_sizes or [16],
+                                                   concurrency or [1], encrypt or [False],
+                                                   interfaces or ['client'])
+        if bulk_benchmark:
+            results['bulk'] = self._bulk_benchmark(bulk_keys)
+        return results or None
+
+    def _benchmark(self, operations, value_sizes, concurrency, encrypt, interfaces):
+        results = []
+        for interface in interfaces:
+            set_value, get_value, delete_value = self._get_datastore_operations(interface)
+
+            for encrypted in encrypt:
+                for value_size in value_sizes:
+                    for threads in concurrency:
+                        prefix = 'st2tests.bench.%s' % (uuid.uuid4().hex[:8])
+                        names = ['%s.%d' % (prefix, index) for index in range(operations)]
+                        value = 'x' * value_size
+
+                        result = {
+                            'interface': interface,
+                            'encrypt': encrypted,
+                            'value_size': value_size,
+                            'concurrency': threads
+                        }
+                        result['set'] = run_concurrently(
+                            lambda name: set_value(name, value, encrypted), names, threads)
+                        result['get'] = run_concurrently(
+                            lambda name: get_value(name, encrypted), names, threads)
+                        result['delete'] = run_concurrently(delete_value, names, threads)
+
+                        print('%(interface)s encrypt=%(encrypt)s value_size=%(value_size)d '
+                              'concurrency=%(concurrency)d' % result)
+                        for operation in ['set', 'get', 'delete']:
+                            print('  %-6s %8.1f ops/s p50 %.4fs p99 %.4fs' % (
+                                operation, result[operation]['ops_per_sec'],
+                                result[operation]['p50'], result[operation]['p99']))
+                        results.append(result)
+
+        return results
+
+    def _bulk_benchmark(self, count):
+        """
+        Compare the bulk datastore paths (list by prefix, ``st2 key load``, ``st2 key
+        delete_by_prefix``) to doing the same one key at a time, and check they give the same
+        results.
+        """
+        client = Client(base_url='http://localhost')
+        prefix = 'st2tests.bulk.%s' % (uuid.uuid4().hex[:8])
+        items = [{'name': '%s.%d' % (prefix, index), 'value': 'value-%d' % (index)}
+                 for index in range(count)]
+        expected = dict((item['name'], item['value']) for item in items)
+        results = {'keys': count}
+
+        def set_loop():
+            for item in items:
+                client.keys.update(KeyValuePair(id=item['name'], **item))
+
+        def get_loop():
+            return dict((item['name'], client.keys.get_by_name(name=item['name']).value)
+                        for item in items)
+
+        def delete_loop():
+            for item in items:
+                client.keys.delete(KeyValuePair(id=item['name'], name=item['name']))
+
+        def st2_cli(*args):
+            with open(os.devnull, 'w') as devnull:
+                subprocess.check_call(['st2'] + list(args), stdout=devnull)
+
+        try:
+            _, results['set_loop'] = timed(set_loop)
+            values, results['get_loop'] = timed(get_loop)
+            self._check_keys(values, expected, 'per key get')
+            values, results['list_by_prefix'] = timed(self._list_by_prefix, client, prefix)
+            self._check_keys(values, expected, 'list by prefix')
+            _, results['delete_loop'] = timed(delete_loop)
+
+            fd, path = tempfile.mkstemp(suffix='.json')
+            try:
+                with os.fdopen(fd, 'w') as fp:
+                    json.dump(items, fp)
+                _, results['load'] = timed(st2_cli, 'key', 'load', path)
+            finally:
+                os.remove(path)
+
+            self._check_keys(self._list_by_prefix(client, prefix), expected, 'st2 key load')
+            _, results['delete_by_prefix'] = timed(st2_cli, 'key', 'delete_by_prefix', '-p',
+                                                   prefix)
+            self._check_keys(self._list_by_prefix(client, prefix), {}, 'st2 key delete_by_prefix')
+        finally:
+            # Don't leave keys behind when a step fails, without masking its error
+            with open(os.devnull, 'w') as devnull:
+                subprocess.call(['st2', 'key', 'delete_by_prefix', '-p', prefix],
+                                stdout=devnull, stderr=devnull)
+
+        print('%d keys: %s' % (count, ', '.join('%s %.2fs' % (name, results[name]) for name in
+                                                ['set_loop', 'load', 'get_loop', 'list_by_prefix',
+                                                 'delete_loop', 'delete_by_prefix'])))
+        return results
+
+    def _list_by_prefix(self, client, prefix, page_size=100):
+        values = {}
+        while True:
+            page = client.keys.get_all(prefix=prefix, limit=page_size, offset=len(values))
+            values.update((key.name, key.value) for key in page)
+            if len(page) < page_size:
+                return values
+
+    def _check_keys(self, values, expected, method):
+        if values != expected:
+            raise Exception('Keys retrieved via %s differ: got %d keys, expected %d.' %
+                            (method, len(values), len(expected)))
+
+    def _get_datastore_operations(self, interface):
+        """
+        :return: ``(set_value, get_value, delete_value)`` functions for the given interface.
+        """
+        if interface == 'action_service':
+            return (
+                lambda name, value, encrypt: self.action_service.set_value(
+                    name=name, value=value, encrypt=encrypt),
+                lambda name, decrypt: self.action_service.get_value(name, decrypt=decrypt),
+                lambda name: self.action_service.delete_value(name)
+            )
+
+        client = Client(base_url='http://localhost')
+        return (
+            lambda name, value, encrypt: client.keys.update(
+                KeyValuePair(id=name, name=name, value=value, secret=encrypt)),
+            lambda name, decrypt: client.keys.get_by_name(
+                name=name, params={'decrypt': str(decrypt).lower()}),
+            lambda name: client.keys.delete(KeyValuePair(id=name, name=name))
+        )
+
     def _test_datastore_actions_via_client(self):
         print('Test datastore access via raw client.')
         client = Client(base_url='http://localhost')
@@ -1,7 +1,13 @@
+import os
 import sys
 
 from st2actions.runners.pythonrunner import Action
 
+# Share the stress writer with the script actions
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'scripts', 'lib'))
+from stress import write_lines  # noqa: E402
+
 __all__ = [
     'StreamWriter'
 ]
@@ -9,7 +15,14 @@ __all__ = [
 
 class StreamWriter(Action):
 
-    def run(self, stream):
+    def run(self, stream, total_bytes=0, line_size=100, rate=0, interleave=False):
+        if stream.upper() not in ['STDOUT', 'STDERR']:
+            raise ValueError('Invalid stream specified.')
+
+        if total_bytes:
+            return write_lines(stream, total_bytes, line_size=line_size, rate=rate,
+                               interleave=interleave)
+
         if stream.upper() == 'STDOUT':
             sys.stdout.write('STREAM IS STDOUT.')
             return stream
@@ -17,5 +30,3 @@ class StreamWriter(Action):
         if stream.upper() == 'STDERR':
             sys.stderr.write('STREAM IS STDERR.')
             return stream
-
-        raise ValueError('Invalid stream specified.')
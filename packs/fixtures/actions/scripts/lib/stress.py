@@ -0,0 +1,103 @@
+from __future__ import division
+
+import sys
+import time
+
+# NOTE: This module is also imported by pythonactions/streamwriter.py which adds this directory
+# to sys.path, so it must not import anything else from lib.
+
+__all__ = [
+    'LINE_PREFIX_SIZE',
+    'format_line',
+    'parse_line',
+    'write_lines'
+]
+
+# "<stream> <seq> <sent_at> " - stream name padded to 6 characters, 10 digit sequence number and a
+# timestamp with microseconds.
+LINE_PREFIX_SIZE = 6 + 1 + 10 + 1 + 17 + 1
+
+
+def format_line(stream_name, seq, sent_at, line_size):
+    """
+    Line of ``line_size`` bytes (including the newline) tagged with the stream, a sequence number
+    and the time it was written so consumers can detect lost and reordered lines and measure
+    delivery latency.
+    """
+    line = '%-6s %010d %17.6f ' % (stream_name, seq, sent_at)
+    return line + 'x' * max(0, line_size - len(line) - 1) + '\n'
+
+
+def parse_line(line):
+    """
+    :return: ``(stream_name, seq, sent_at)`` tuple or ``None`` if this is not a stress line.
+    """
+    parts = line.split(None, 3)
+    if len(parts) < 3 or parts[0] not in ('stdout', 'stderr'):
+        return None
+
+    try:
+        return parts[0], int(parts[1]), float(parts[2])
+    except ValueError:
+        return None
+
+
+def write_lines(stream, total_bytes, line_size=100, rate=0, interleave=False):
+    """
+    Write ``total_bytes`` of output in lines of ``line_size`` bytes.
+
+    Lines are written at ``rate`` lines per second (``0`` for as fast as possible), scheduled
+    against the start time so time spent in blocking writes doesn't lower the rate. With
+    ``interleave`` lines alternate between stdout and stderr, otherwise they all go to ``stream``.
+
+    Writes block when whatever reads the output can't keep up, so the observed rate is the rate
+    at which the output is actually being captured.
+
+    :return: Report comparing the written and the requested throughput.
+    :rtype: ``dict``
+    """
+    line_size = max(line_size, LINE_PREFIX_SIZE + 1)
+    streams = {
+        'stdout': sys.stdout,
+        'stderr': sys.stderr
+    }
+    if interleave:
+        names = ['stdout', 'stderr']
+    else:
+        names = [stream.lower()]
+
+    written = dict((name, 0) for name in names)
+    lines = int(total_bytes // line_size)
+    late_lines = 0
+    max_lag = 0.0
+
+    start_time = time.time()
+    for seq in range(lines):
+        if rate:
+            delay = start_time + seq / rate - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            elif seq:
+                late_lines += 1
+                max_lag = max(max_lag, -delay)
+
+        name = names[seq % len(names)]
+        line = format_line(name, seq, time.time(), line_size)
+        streams[name].write(line)
+        streams[name].flush()
+        written[name] += len(line)
+    elapsed = time.time() - start_time
+
+    bytes_written = sum(written.values())
+    return {
+        'lines': lines,
+        'line_size': line_size,
+        'bytes_written': bytes_written,
+        'bytes_written_per_stream': written,
+        'elapsed': elapsed,
+        'target_bytes_per_sec': rate * line_size if rate else None,
+        'observed_bytes_per_sec': bytes_written / elapsed if elapsed else None,
+        'observed_lines_per_sec': lines / elapsed if elapsed else None,
+        'late_lines': late_lines,
+        'max_lag': max_lag
+    }
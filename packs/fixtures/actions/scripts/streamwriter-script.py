@@ -1,11 +1,13 @@
 #!/opt/stackstorm/virtualenvs/fixtures/bin/python
 
 import argparse
+import json
 import sys
 import ast
 import re
 
 from lib.exceptions import CustomException
+from lib.stress import write_lines
 
 
 class StreamWriter(object):
@@ -22,8 +24,21 @@ class StreamWriter(object):
         raise CustomException('Invalid stream specified.')
 
 
+def str_to_bool(value):
+    return str(value).lower() in ['true', '1', 'yes']
+
+
 def main(args):
     stream = args.stream
+    if args.total_bytes:
+        if stream.upper() not in ['STDOUT', 'STDERR']:
+            raise CustomException('Invalid stream specified.')
+
+        report = write_lines(stream, args.total_bytes, line_size=args.line_size,
+                             rate=args.rate, interleave=args.interleave)
+        sys.stdout.write('STRESS REPORT: %s\n' % json.dumps(report, sort_keys=True))
+        return
+
     writer = StreamWriter()
     stream = writer.run(stream)
 
@@ -49,5 +64,13 @@ if __name__ == '__main__':
     parser.add_argument('--str_arg', help='Some string arg.')
     parser.add_argument('--int_arg', help='Some int arg.', type=float)
     parser.add_argument('--obj_arg', help='Some dict arg.', type=ast.literal_eval)
+    parser.add_argument('--total_bytes', help='Stress mode - bytes of output to write.',
+                        type=int, default=0)
+    parser.add_argument('--line_size', help='Stress mode - size of every line.', type=int,
+                        default=100)
+    parser.add_argument('--rate', help='Stress mode - lines per second, 0 for unthrottled.',
+                        type=float, default=0)
+    parser.add_argument('--interleave', help='Stress mode - alternate stdout and stderr.',
+                        type=str_to_bool, default=False)
     args = parser.parse_args()
     main(args)
@@ -0,0 +1,106 @@
+import threading
+import time
+
+__all__ = [
+    'TriggerBatcher'
+]
+
+
+class TriggerBatcher(object):
+    """
+    Accumulate trigger payloads and dispatch them together once ``max_size`` payloads are
+    queued or the oldest queued payload is ``max_wait`` seconds old.
+
+    Payloads are dispatched by a flusher thread, ``add()`` only queues them and wakes the thread
+    when a batch is full. The sensor service has no bulk dispatch API, so the thread still
+    dispatches every payload on its own, back to back.
+    """
+
+    def __init__(self, dispatch, max_size, max_wait):
+        self._dispatch = dispatch
+        self.max_size = max_size
+        self.max_wait = max_wait
+
+        self._pending = []
+        self._first_added = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._full = threading.Event()
+        self._thread = None
+
+        self.batches = 0
+        self.events = 0
+        self.max_batch_size = 0
+        self.total_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._flush_when_due)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._full.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def add(self, trigger, payload):
+        with self._lock:
+            if not self._pending:
+                self._first_added = time.time()
+            self._pending.append((trigger, payload))
+            full = len(self._pending) >= self.max_size
+
+        if full:
+            self._full.set()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                first_added = self._first_added
+
+            if not batch:
+                return
+
+            for trigger, payload in batch:
+                self._dispatch(trigger, payload)
+
+            # Time from queueing the oldest payload of the batch until all of it is dispatched
+            latency = time.time() - first_added
+            self.batches += 1
+            self.events += len(batch)
+            self.max_batch_size = max(self.max_batch_size, len(batch))
+            self.total_flush_latency += latency
+            self.max_flush_latency = max(self.max_flush_latency, latency)
+
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'events': self.events,
+            'mean_batch_size': float(self.events) / self.batches if self.batches else 0,
+            'max_batch_size': self.max_batch_size,
+            'mean_flush_latency': self.total_flush_latency / self.batches if self.batches else 0,
+            'max_flush_latency': self.max_flush_latency
+        }
+
+    def _flush_when_due(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                if self._pending:
+                    timeout = max(0, self._first_added + self.max_wait - time.time())
+                else:
+                    timeout = self.max_wait
+            self._full.wait(timeout)
+            self._full.clear()
+
+            with self._lock:
+                due = self._pending and (len(self._pending) >= self.max_size
+                                         or time.time() - self._first_added >= self.max_wait)
+            if due:
+                self.flush()
@@ -0,0 +1,70 @@
+import random
+import threading
+import time
+
+__all__ = [
+    'LoadGenerator'
+]
+
+
+class LoadGenerator(object):
+    """
+    Emit events at a target rate in bursts of ``burst_size`` events.
+
+    Bursts are scheduled against the start time instead of sleeping a fixed time after every
+    burst, so time spent emitting doesn't lower the rate. When emitting can't keep up, bursts
+    go out back to back and the delay behind the schedule is recorded as lag.
+
+    :param emit: Called with the payload size of every event.
+    :param payload_sizes: Sizes to pick from at random, repeat a size to make it more likely.
+    :param duration: Seconds to generate load for, ``0`` to run until stopped.
+    """
+
+    def __init__(self, emit, rate, burst_size=1, payload_sizes=None, duration=0):
+        self._emit = emit
+        self.rate = float(rate)
+        self.burst_size = burst_size
+        self.payload_sizes = payload_sizes or [0]
+        self.duration = duration
+
+        self._stopped = threading.Event()
+
+        self.emitted = 0
+        self.late_bursts = 0
+        self.max_lag = 0.0
+
+    def run(self):
+        burst_interval = self.burst_size / self.rate
+        start_time = time.time()
+        burst = 0
+
+        while not self._stopped.is_set():
+            scheduled = start_time + burst * burst_interval
+            if self.duration and scheduled - start_time >= self.duration:
+                break
+
+            delay = scheduled - time.time()
+            if delay > 0:
+                if self._stopped.wait(delay):
+                    break
+            elif burst:
+                self.late_bursts += 1
+                self.max_lag = max(self.max_lag, -delay)
+
+            for _ in range(self.burst_size):
+                self._emit(random.choice(self.payload_sizes))
+                self.emitted += 1
+            burst += 1
+
+    def stop(self):
+        self._stopped.set()
+
+    def wait_for_stop(self):
+        self._stopped.wait()
+
+    def stats(self):
+        return {
+            'emitted': self.emitted,
+            'late_bursts': self.late_bursts,
+            'max_lag': self.max_lag
+        }
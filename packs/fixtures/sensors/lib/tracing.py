@@ -0,0 +1,36 @@
+import itertools
+import threading
+import time
+import uuid
+
+__all__ = [
+    'PayloadStamper'
+]
+
+
+class PayloadStamper(object):
+    """
+    Add a ``trace`` object with the sensor run id, a sequence number and the send time to
+    trigger payloads.
+
+    The send time is compared to timestamps recorded by other st2 services, so it is wall clock
+    time. It never goes backwards though, which keeps the times ordered like the sequence numbers
+    if the clock is adjusted while the sensor is running.
+    """
+
+    def __init__(self):
+        self.run_id = uuid.uuid4().hex
+        self._sequence = itertools.count(1)
+        self._last_time = 0.0
+        self._lock = threading.Lock()
+
+    def stamp(self, data):
+        with self._lock:
+            self._last_time = max(self._last_time, time.time())
+            trace = {
+                'run': self.run_id,
+                'seq': next(self._sequence),
+                'sent_at': self._last_time
+            }
+
+        return dict(data, trace=trace)
@@ -1,6 +1,5 @@
 # Requirements:
 # See ../requirements.txt
-# import datetime
 
 import json
 
@@ -8,6 +7,9 @@ from flask import Flask
 
 from st2reactor.sensor.base import Sensor
 
+from lib.batching import TriggerBatcher
+from lib.tracing import PayloadStamper
+
 SAMPLE_PAYLOAD = {
     'str': 'String',
     'int': 1,
@@ -28,22 +30,52 @@ class TestPassiveSensor(Sensor):
         self._trigger_ref = '.'.join([self._trigger_pack, 'test_passive_trigger.dummy'])
         self.host = self._config['host']
         self.port = self._config['port']
+        self.workers = self._config.get('workers', 1)
         self.app = Flask(__name__)
+        self._server = None
+        self._logger = self._sensor_service.get_logger(name=self.__class__.__name__)
+
+        self._stamper = PayloadStamper()
+
+        self._batcher = None
+        if self._config.get('dispatch_batch_size', 1) > 1:
+            self._batcher = TriggerBatcher(self._sensor_service.dispatch,
+                                           max_size=self._config['dispatch_batch_size'],
+                                           max_wait=self._config.get('dispatch_batch_window', 0.1))
 
     def setup(self):
         @self.app.route('/webhooks/<path:endpoint>', methods=['POST', 'GET'])
         def handle_ep(endpoint):
             if endpoint == 'passivesensor/test':
                 return self._handle_webhook(endpoint)
+            elif endpoint == 'passivesensor/stats':
+                return json.dumps(self._batcher.stats() if self._batcher else {})
             else:
                 raise Exception('Unhandled endpoint: %s', endpoint)
 
     def run(self):
-        # Stopped
-        self.app.run(host=self.host, port=self.port, threaded=False)
+        if self._batcher:
+            self._batcher.start()
+
+        if self.workers > 1:
+            # Flask's development server handles one request at a time which makes the sensor
+            # the bottleneck when load testing the trigger pipeline.
+            from waitress import create_server
+
+            self._server = create_server(self.app, host=self.host, port=self.port,
+                                         threads=self.workers)
+            self._server.run()
+        else:
+            # Stopped
+            self.app.run(host=self.host, port=self.port, threaded=False)
 
     def cleanup(self):
-        pass
+        if self._server:
+            self._server.close()
+
+        if self._batcher:
+            self._batcher.stop()
+            self._logger.info('Batched dispatch stats: %s', self._batcher.stats())
 
     def add_trigger(self, trigger):
         pass
@@ -59,5 +91,8 @@ class TestPassiveSensor(Sensor):
         return json.dumps(SAMPLE_PAYLOAD)
 
     def _dispatch_trigger(self, trigger, data):
-        # data['timestamp'] = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-        self._sensor_service.dispatch(trigger, data)
+        data = self._stamper.stamp(data)
+        if self._batcher:
+            self._batcher.add(trigger, data)
+        else:
+            self._sensor_service.dispatch(trigger, data)
@@ -1,9 +1,15 @@
 # Requirements:
 # See ../requirements.txt
-# import datetime
+
+import copy
+import json
 
 from st2reactor.sensor.base import PollingSensor
 
+from lib.batching import TriggerBatcher
+from lib.load import LoadGenerator
+from lib.tracing import PayloadStamper
+
 SAMPLE_PAYLOAD = {
     'str': 'String',
     'int': 1,
@@ -23,16 +29,55 @@ class TestPollingSensor(PollingSensor):
                                                 poll_interval=poll_interval)
         self._trigger_pack = 'fixtures'
         self._trigger_ref = '.'.join([self._trigger_pack, 'test_trigger.dummy'])
+        self._logger = self._sensor_service.get_logger(name=self.__class__.__name__)
+
+        self._stamper = PayloadStamper()
+
+        self._batcher = None
+        if self._config.get('dispatch_batch_size', 1) > 1:
+            self._batcher = TriggerBatcher(self._sensor_service.dispatch,
+                                           max_size=self._config['dispatch_batch_size'],
+                                           max_wait=self._config.get('dispatch_batch_window', 0.1))
+
+        self._load_generator = None
+        if self._config.get('load_rate'):
+            self._load_generator = LoadGenerator(
+                self._emit_load_event,
+                rate=self._config['load_rate'],
+                burst_size=self._config.get('load_burst_size', 1),
+                payload_sizes=self._config.get('load_payload_sizes'),
+                duration=self._config.get('load_duration', 0))
 
     def setup(self):
-        pass
+        if self._batcher:
+            self._batcher.start()
+
+    def run(self):
+        if not self._load_generator:
+            return super(TestPollingSensor, self).run()
+
+        # Instead of one event per poll interval, emit events at the configured rate
+        self._load_generator.run()
+        self._logger.info('Load generator stats: %s', self._load_generator.stats())
+
+        # The sensor container restarts sensors which return from run()
+        self._load_generator.wait_for_stop()
 
     def poll(self):
         # Stopped
         self._dispatch_trigger(self._trigger_ref, data=SAMPLE_PAYLOAD)
 
+        if self._batcher:
+            self._sensor_service.set_value('test_poll_sensor.dispatch_stats',
+                                           json.dumps(self._batcher.stats()))
+
     def cleanup(self):
-        pass
+        if self._load_generator:
+            self._load_generator.stop()
+
+        if self._batcher:
+            self._batcher.stop()
+            self._logger.info('Batched dispatch stats: %s', self._batcher.stats())
 
     def add_trigger(self, trigger):
         pass
@@ -43,6 +88,14 @@ class TestPollingSensor(PollingSensor):
     def remove_trigger(self, trigger):
         pass
 
+    def _emit_load_event(self, payload_size):
+        data = copy.deepcopy(SAMPLE_PAYLOAD)
+        data['padding'] = 'x' * payload_size
+        self._dispatch_trigger(self._trigger_ref, data=data)
+
     def _dispatch_trigger(self, trigger, data):
-        # data['timestamp'] = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-        self._sensor_service.dispatch(trigger, data)
+        data = self._stamper.stamp(data)
+        if self._batcher:
+            self._batcher.add(trigger, data)
+        else:
+            self._sensor_service.dispatch(trigger, data)
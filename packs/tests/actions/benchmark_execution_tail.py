@@ -0,0 +1,312 @@
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+from six.moves.urllib.parse import urlencode
+from st2client.models import Execution
+
+from st2common.runners.base_action import Action
+
+from lib.client import get_client
+from lib.stats import summarize
+
+__all__ = [
+    'BenchmarkExecutionTailAction'
+]
+
+FINISHED_STATUSES = ['succeeded', 'failed', 'timeout', 'canceled', 'abandoned']
+TAIL_EVENTS = ['st2.execution__update', 'st2.execution.output__create']
+
+# Lines written by the fixtures.streamwriter* actions in stress mode:
+# "<stream> <seq> <sent_at> xxx..."
+STRESS_LINE_RE = re.compile(r'^(stdout|stderr)\s+(\d+)\s+(\d+\.\d+)\s')
+STRESS_REPORT_RE = re.compile(r'STRESS REPORT: (\{.*\})')
+
+
+class TailClient(object):
+    """
+    Consume the event stream like ``st2 execution tail`` does and record when every output line
+    of ``root_id`` and its children was received.
+
+    Events are parsed on arrival and only ``(received_at, execution_id, output_type, seq,
+    sent_at)`` is kept for every complete line, ``seq`` and ``sent_at`` are ``None`` for lines
+    which aren't stress mode lines. The stream carries the events of every execution and
+    ``root_id`` is only known once the execution has been created, so until then lines of every
+    execution are kept and the ones of other executions are dropped afterwards.
+    """
+
+    def __init__(self, client, token):
+        self.client = client
+        self.token = token
+        self.root_id = None
+        self.lines = []
+        self.completed_at = None
+        self.finished = threading.Event()
+        self.abandoned = False
+        self.error = None
+
+        # Parent and completion time of every execution seen while root_id was unknown
+        self._seen = {}
+        self._execution_ids = None
+        self._partial = {}
+        self._response = None
+        self._thread = threading.Thread(target=self._listen)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def abandon(self):
+        """
+        Stop a client which didn't see the completion in time, so it doesn't keep consuming the
+        event stream while later runs are measured.
+        """
+        self.abandoned = True
+        if self._response is not None:
+            self._response.close()
+        self._thread.join(5)
+
+        # Nothing may have been received since root_id was set
+        if self.root_id and self._execution_ids is None and not self._thread.is_alive():
+            self._track_root()
+
+    def _listen(self):
+        # Same request as StreamManager.listen, which doesn't expose the response to close it
+        from sseclient import SSEClient
+
+        token = self.token or os.environ.get('ST2_AUTH_TOKEN')
+        headers = {'X-Auth-Token': token} if token else {}
+        url = '%s/stream?%s' % (self.client.endpoints['stream'],
+                                urlencode({'events': ','.join(TAIL_EVENTS)}))
+        try:
+            self._response = requests.get(url, headers=headers, stream=True,
+                                          verify=self.client.cacert or True)
+            for message in SSEClient(self._response).events():
+                if self.abandoned:
+                    break
+                if not message.data:
+                    continue
+
+                self._record(time.time(), json.loads(message.data))
+                if self.completed_at is not None:
+                    break
+        except Exception as e:
+            if not self.abandoned:
+                self.error = str(e)
+        finally:
+            if self._response is not None:
+                self._response.close()
+            self.finished.set()
+
+    def _record(self, received_at, event):
+        if self.root_id and self._execution_ids is None:
+            self._track_root()
+
+        if 'output_type' not in event:
+            parent = event.get('context', {}).get('parent', {}).get('execution_id')
+            finished = event.get('status') in FINISHED_STATUSES
+            if self._execution_ids is None:
+                self._seen[event.get('id')] = (parent, received_at if finished else None)
+            elif parent in self._execution_ids:
+                self._execution_ids.add(event['id'])
+
+            if finished and event.get('id') == self.root_id:
+                self.completed_at = received_at
+            return
+
+        execution_id = event.get('execution_id')
+        if self._execution_ids is not None and execution_id not in self._execution_ids:
+            return
+
+        key = (execution_id, event['output_type'])
+        complete = (self._partial.get(key, '') + event.get('data', '')).split('\n')
+        self._partial[key] = complete.pop()
+        for line in complete:
+            match = STRESS_LINE_RE.match(line)
+            if match:
+                self.lines.append((received_at, key[0], key[1], int(match.group(2)),
+                                   float(match.group(3))))
+            else:
+                self.lines.append((received_at, key[0], key[1], None, None))
+
+    def _track_root(self):
+        """
+        Work out the executions of the tree once ``root_id`` is known and drop what was kept
+        for other executions.
+        """
+        execution_ids = set([self.root_id])
+        added = True
+        while added:
+            children = set(execution_id for execution_id, (parent, _) in self._seen.items()
+                           if parent in execution_ids)
+            added = children - execution_ids
+            execution_ids |= children
+
+        # Short actions can finish before the execution id is known
+        if self.root_id in self._seen:
+            self.completed_at = self._seen[self.root_id][1]
+
+        self._execution_ids = execution_ids
+        self._seen = {}
+        self.lines = [line for line in self.lines if line[1] in execution_ids]
+        self._partial = dict((key, data) for key, data in self._partial.items()
+                             if key[0] in execution_ids)
+
+
+def expected_lines(execution):
+    """
+    Number of lines a stress mode streamwriter execution reported writing, ``None`` for other
+    actions.
+    """
+    result = execution.result or {}
+    if isinstance(result.get('result'), dict) and 'lines' in result['result']:
+        return result['result']['lines']
+
+    match = STRESS_REPORT_RE.search(result.get('stdout') or '')
+    if match:
+        return json.loads(match.group(1))['lines']
+
+    return None
+
+
+def analyze(tail_client, started_at, lines_expected):
+    """
+    Delivery statistics of the lines one tail client received.
+    """
+    latencies = []
+    seen = set()
+    duplicates = 0
+    reordered = 0
+    last_seq = {}
+    other_lines = 0
+
+    lines = tail_client.lines
+    for received_at, execution_id, output_type, seq, sent_at in lines:
+        if seq is None:
+            other_lines += 1
+            continue
+
+        latencies.append(received_at - sent_at)
+        if seq in seen:
+            duplicates += 1
+        seen.add(seq)
+
+        # stdout and stderr are captured separately, so order is only kept within a stream
+        key = (execution_id, output_type)
+        if seq < last_seq.get(key, -1):
+            reordered += 1
+        last_seq[key] = max(seq, last_seq.get(key, -1))
+
+    if lines_expected is None and seen:
+        lines_expected = max(seen) + 1
+
+    completed_at = tail_client.completed_at
+    return {
+        'lines_received': len(lines),
+        'other_lines': other_lines,
+        'lost': len(set(range(lines_expected or 0)) - seen),
+        'duplicates': duplicates,
+        'reordered': reordered,
+        'first_line_after': lines[0][0] - started_at if lines else None,
+        'completion_after_last_line': (completed_at - lines[-1][0]
+                                       if completed_at and lines else None),
+        'completed': completed_at is not None,
+        'abandoned': tail_client.abandoned,
+        'error': tail_client.error,
+        'latencies': latencies
+    }
+
+
+class BenchmarkExecutionTailAction(Action):
+    def run(self, action, parameters, tail_clients, max_wait, connect_wait, token=None,
+            protocol='http', hostname='127.0.0.1'):
+        """
+        Run ``action`` once for every number of concurrent tail clients and report line
+        delivery latency, lost, duplicated and reordered lines.
+
+        Latency is measured against the write time in the lines of the fixtures.streamwriter*
+        stress mode, so it includes clock skew when the action runs on another host. For other
+        actions (e.g. the examples pack streaming demos) only line counts and the time to the
+        first line are reported.
+        """
+        client = get_client(token, protocol, hostname)
+
+        results = []
+        for count in sorted(tail_clients):
+            results.append(self._run_once(client, action, parameters, count, max_wait,
+                                          connect_wait, token))
+
+        print('%8s %-10s %12s %8s %8s %10s %10s %10s %10s' % (
+            'CLIENTS', 'STATUS', 'LINES', 'LOST', 'REORDER', 'P50', 'P95', 'MAX', 'ABANDONED'))
+        for result in results:
+            latency = result['latency']
+            print('%8d %-10s %12d %8d %8d %10s %10s %10s %10d' % (
+                result['tail_clients'], result['status'], result['lines_received'],
+                result['lost'], result['reordered'], _seconds(latency.get('p50')),
+                _seconds(latency.get('p95')), _seconds(latency.get('max')),
+                result['abandoned']))
+
+        # Highest number of clients which all received every line
+        sustained = [result['tail_clients'] for result in results
+                     if result['lost'] == 0 and result['completed'] == result['tail_clients']]
+        report = {
+            'action': action,
+            'runs': results,
+            'sustained_tail_clients': max(sustained) if sustained else 0
+        }
+        return len(sustained) == len(results), report
+
+    def _run_once(self, client, action, parameters, count, max_wait, connect_wait, token):
+        tail_clients = [TailClient(client, token) for _ in range(count)]
+        for tail_client in tail_clients:
+            tail_client.start()
+
+        # There is no way to tell when a client is subscribed, events sent before are not
+        # replayed.
+        time.sleep(connect_wait)
+
+        started_at = time.time()
+        execution = client.executions.create(Execution(action=action,
+                                                       parameters=parameters or {}))
+        for tail_client in tail_clients:
+            tail_client.root_id = execution.id
+
+        deadline = started_at + max_wait
+        for tail_client in tail_clients:
+            tail_client.finished.wait(max(0, deadline - time.time()))
+
+        for tail_client in tail_clients:
+            if not tail_client.finished.is_set():
+                tail_client.abandon()
+
+        execution = client.executions.get_by_id(execution.id)
+        lines_expected = expected_lines(execution)
+
+        analyses = [analyze(tail_client, started_at, lines_expected)
+                    for tail_client in tail_clients]
+        latencies = []
+        for analysis in analyses:
+            latencies.extend(analysis.pop('latencies'))
+
+        return {
+            'tail_clients': count,
+            'execution_id': execution.id,
+            'status': execution.status,
+            'lines_expected': lines_expected,
+            'lines_received': sum(analysis['lines_received'] for analysis in analyses),
+            'lost': sum(analysis['lost'] for analysis in analyses),
+            'duplicates': sum(analysis['duplicates'] for analysis in analyses),
+            'reordered': sum(analysis['reordered'] for analysis in analyses),
+            'completed': len([analysis for analysis in analyses if analysis['completed']]),
+            # Clients which hadn't seen the completion by max_wait, they were disconnected
+            'abandoned': len([analysis for analysis in analyses if analysis['abandoned']]),
+            'latency': summarize(latencies),
+            'clients': analyses
+        }
+
+
+def _seconds(value):
+    return '%.3fs' % (value) if value is not None else '-'
@@ -0,0 +1,73 @@
+import json
+
+from st2common.runners.base_action import Action
+
+from lib.client import get_client
+from lib.timings import task_timings
+
+__all__ = [
+    'ChainTimingsAction'
+]
+
+
+def _task_name(execution):
+    context = getattr(execution, 'context', None) or {}
+    for runner in ['chain', 'orquesta', 'mistral']:
+        task = context.get(runner) or {}
+        if task.get('name') or task.get('task_name'):
+            return task.get('name') or task.get('task_name')
+    return execution.action['ref']
+
+
+class ChainTimingsAction(Action):
+    def run(self, execution_id=None, action=None, output_file=None, token=None,
+            protocol='http', hostname='127.0.0.1'):
+        """
+        Report per task timings of a finished workflow execution (by default the latest
+        execution of ``action``), including nested workflows.
+        """
+        client = get_client(token, protocol, hostname)
+
+        if not execution_id:
+            if not action:
+                raise ValueError('Either execution_id or action is required.')
+            latest = client.executions.query(action=action, limit=1)
+            if not latest:
+                raise ValueError('No executions of "%s" found.' % (action))
+            execution_id = latest[0].id
+
+        execution = client.executions.get_by_id(execution_id)
+        children = client.executions.get_property(execution_id, 'children', depth=-1)
+        children = sorted(children, key=lambda child: child.start_timestamp)
+
+        depth = {execution.id: 0}
+        tasks = []
+        for child in children:
+            depth[child.id] = depth.get(child.parent, 0) + 1
+            task = {
+                'task': _task_name(child),
+                'depth': depth[child.id],
+                'execution_id': child.id,
+                'action': child.action['ref'],
+                'runner_type': child.runner['name'],
+                'status': child.status
+            }
+            task.update(task_timings(child))
+            tasks.append(task)
+
+        report = dict(task_timings(execution), execution_id=execution.id,
+                      action=execution.action['ref'], status=execution.status, tasks=tasks)
+
+        print('%-50s %-18s %-10s %10s %10s' % ('TASK', 'RUNNER', 'STATUS', 'QUEUED',
+                                               'DURATION'))
+        for task in tasks:
+            print('%-50s %-18s %-10s %10s %10s' % (
+                '  ' * (task['depth'] - 1) + task['task'], task['runner_type'], task['status'],
+                '%.2fs' % task['queue_delay'] if task['queue_delay'] is not None else '-',
+                '%.2fs' % task['duration'] if task['duration'] is not None else '-'))
+
+        if output_file:
+            with open(output_file, 'w') as fp:
+                json.dump(report, fp, indent=2, sort_keys=True)
+
+        return report
@@ -12,44 +12,90 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from st2common.constants.pack import PACK_VERSION_SEPARATOR
+import os
+
 from st2common.runners.base_action import Action
-from st2common.util.pack import get_pack_metadata
-from st2common.util.pack_management import get_repo_url
+
+from lib.pack_index import DEFAULT_CACHE_DIR, load_index
+from lib.packs import PACKS_PATH, get_installed_version, parse_installed_pack
 
 
 class CheckInstalledPackVersionAction(Action):
-    def run(self, installed_pack, **kwargs):
+    def run(self, installed_pack=None, installed_packs=None, index_url=None, index_file=None,
+            cache_dir=DEFAULT_CACHE_DIR, cache_ttl=300, **kwargs):
         """
         :param installed_pack: Installed pack name with version
         :type: installed_pack: ``string``
+
+        :param installed_packs: Installed pack names with versions, checked in the same run.
+        :type: installed_packs: ``list``
+
+        The index is only loaded (once) when a pack without version is checked.
+
+        :return: ``(success, report)`` tuple, ``report`` has an ``error`` for every pack which
+                 couldn't be checked, or only an ``error`` when no pack was given.
         """
+        installed_packs = list(installed_packs or [])
+        if installed_pack:
+            installed_packs.insert(0, installed_pack)
 
-        if not installed_pack:
-            return False, False
+        if not installed_packs:
+            print('No installed pack given.')
+            return False, {'error': 'No installed pack given.'}
 
-        pack_and_version = installed_pack.split(PACK_VERSION_SEPARATOR)
-        pack_name = pack_and_version[0]
-        pack_version = pack_and_version[1] if len(pack_and_version) > 1 else None
+        packs = [parse_installed_pack(pack) for pack in installed_packs]
+
+        index = {}
+        index_error = None
+        if any(pack_version is None for _, pack_version in packs):
+            try:
+                index, sources = load_index([index_url] if index_url else None,
+                                            index_file=index_file, cache_dir=cache_dir,
+                                            ttl=cache_ttl)
+            except Exception as e:
+                index_error = 'Failed to load the pack index: %s' % (e)
+                print(index_error)
+            else:
+                for source, status in sources.items():
+                    print('Index %s: %s' % (source, status))
+
+        report = {}
+        for pack_name, pack_version in packs:
+            report[pack_name] = self._check_pack(pack_name, pack_version, index, index_error)
+
+        success = all(result['matches'] for result in report.values())
+        return success, report
+
+    def _check_pack(self, pack_name, pack_version, index, index_error=None):
+        result = {
+            'expected_version': pack_version,
+            'installed_version': None,
+            'matches': False,
+            'error': None
+        }
 
         # Pack version is not specified. Get pack version from index.json file.
         if not pack_version:
-            try:
-                _, pack_version = get_repo_url(pack_name, proxy_config=None)
-            except Exception:
-                print ('No record of the "%s" pack in the index.' % (pack_name))
-                return False, False
+            if index_error:
+                result['error'] = index_error
+                return result
+            if pack_name not in index:
+                result['error'] = 'No record of the "%s" pack in the index.' % (pack_name)
+                print(result['error'])
+                return result
+            result['expected_version'] = index[pack_name].get('version', None)
 
-        # Get installed pack version from local pack metadata file.
         try:
-            pack_dir = '/opt/stackstorm/packs/%s/' % (pack_name)
-            pack_metadata = get_pack_metadata(pack_dir=pack_dir)
-            local_pack_version = pack_metadata.get('version', None)
+            result['installed_version'] = get_installed_version(pack_name)
         except Exception:
-            print ('Could not open pack.yaml file at location %s' % (pack_dir))
-            return False, False
+            result['error'] = 'Could not open pack.yaml file at location %s' % (
+                os.path.join(PACKS_PATH, pack_name))
+            print(result['error'])
+            return result
 
-        if pack_version == local_pack_version:
-            return True, True
-        else:
-            return False, False
+        result['matches'] = result['expected_version'] == result['installed_version']
+        if not result['matches']:
+            result['error'] = 'Pack "%s" version %s does not match the expected version %s.' % (
+                pack_name, result['installed_version'], result['expected_version'])
+            print(result['error'])
+        return result
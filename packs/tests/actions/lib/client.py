@@ -0,0 +1,69 @@
+import calendar
+import datetime
+
+from st2client.client import Client
+
+__all__ = [
+    'format_timestamp',
+    'get_client',
+    'parse_timestamp',
+    'query_all'
+]
+
+PAGE_SIZE = 100
+
+API_TIMESTAMP_FORMATS = [
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%dT%H:%M:%SZ'
+]
+
+
+def get_client(token, protocol, hostname):
+    """
+    Client for the st2 instance the test chains run against, see the ``token``, ``protocol``
+    and ``hostname`` parameters of the test actions.
+    """
+    base_url = '%s://%s' % (protocol, hostname)
+    return Client(base_url=base_url,
+                  auth_url='%s:9100' % (base_url),
+                  api_url='%s:9101' % (base_url),
+                  token=token or None)
+
+
+def parse_timestamp(value):
+    """
+    Convert an API timestamp (UTC, e.g. "2019-10-29T10:01:02.123456Z") to epoch seconds.
+    """
+    value = value.replace('+00:00', 'Z')
+    for timestamp_format in API_TIMESTAMP_FORMATS:
+        try:
+            parsed = datetime.datetime.strptime(value, timestamp_format)
+        except ValueError:
+            continue
+        return calendar.timegm(parsed.timetuple()) + parsed.microsecond / 1000000.0
+
+    raise ValueError('Unsupported timestamp format: %s' % (value))
+
+
+def format_timestamp(value):
+    """
+    Convert epoch seconds to an API timestamp, e.g. for ``timestamp_gt`` filters.
+    """
+    return datetime.datetime.utcfromtimestamp(value).strftime(API_TIMESTAMP_FORMATS[0])
+
+
+def query_all(manager, limit=None, **filters):
+    """
+    Page through all the resources matching ``filters`` (newest first), up to ``limit``.
+
+    :rtype: ``list``
+    """
+    resources = []
+    while limit is None or len(resources) < limit:
+        page_size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - len(resources))
+        page = manager.query(offset=len(resources), limit=page_size, **filters)
+        resources.extend(page)
+        if len(page) < page_size:
+            break
+
+    return resources
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import time
+
+import requests
+
+__all__ = [
+    'DEFAULT_CACHE_DIR',
+    'fetch_index',
+    'load_index'
+]
+
+DEFAULT_CACHE_DIR = '/tmp/st2tests_pack_index'
+
+
+def _default_index_urls():
+    from oslo_config import cfg
+    return cfg.CONF.content.index_url
+
+
+def _cache_path(cache_dir, index_url):
+    digest = hashlib.sha1(index_url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, '%s.json' % (digest))
+
+
+def _read_cache(path):
+    """
+    :return: Cache entry or ``None`` if there is no usable entry.
+    """
+    try:
+        with open(path) as fp:
+            entry = json.load(fp)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or 'fetched_at' not in entry or 'packs' not in entry:
+        return None
+    return entry
+
+
+def _write_cache(path, entry):
+    # Write and rename so concurrent runs never read a partial file
+    tmp_path = '%s.%d' % (path, os.getpid())
+    with open(tmp_path, 'w') as fp:
+        json.dump(entry, fp)
+    os.rename(tmp_path, path)
+
+
+def fetch_index(index_url, cache_dir=DEFAULT_CACHE_DIR, ttl=300):
+    """
+    Fetch an index through an on-disk cache.
+
+    A cached index younger than ``ttl`` seconds is used as is. An older one is revalidated with
+    its ETag / Last-Modified and is still used, when the index can't be fetched.
+
+    :return: ``(packs, source)`` tuple, source is ``cache``, ``not modified``, ``fetched`` or
+             ``stale cache``.
+    """
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    path = _cache_path(cache_dir, index_url)
+    cached = _read_cache(path)
+    if cached and time.time() - cached['fetched_at'] < ttl:
+        return cached['packs'], 'cache'
+
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        response = requests.get(index_url, headers=headers, timeout=30)
+        if response.status_code == 304 and cached:
+            cached['fetched_at'] = time.time()
+            _write_cache(path, cached)
+            return cached['packs'], 'not modified'
+
+        response.raise_for_status()
+        packs = response.json()['packs']
+    except Exception:
+        if cached:
+            return cached['packs'], 'stale cache'
+        raise
+
+    _write_cache(path, {
+        'index_url': index_url,
+        'fetched_at': time.time(),
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'packs': packs
+    })
+    return packs, 'fetched'
+
+
+def load_index(index_urls=None, index_file=None, cache_dir=DEFAULT_CACHE_DIR, ttl=300):
+    """
+    Load the packs of one or more indexes. Like ``st2 pack install``, packs in the first index
+    take precedence over packs in later ones.
+
+    :param index_urls: Index URLs, defaults to the ``content.index_url`` st2 config option.
+    :param index_file: Local index.json to use instead, e.g. on nodes without network access.
+
+    :return: ``(packs, sources)`` tuple, ``sources`` tells where every index was loaded from.
+    """
+    if index_file:
+        with open(index_file) as fp:
+            return json.load(fp)['packs'], {index_file: 'file'}
+
+    packs = {}
+    sources = {}
+    # Merge in reverse, so earlier indexes overwrite later ones
+    for index_url in list(index_urls or _default_index_urls())[::-1]:
+        index_packs, sources[index_url] = fetch_index(index_url, cache_dir=cache_dir, ttl=ttl)
+        packs.update(index_packs)
+
+    return packs, sources
@@ -0,0 +1,30 @@
+import os
+
+from st2common.constants.pack import PACK_VERSION_SEPARATOR
+from st2common.util.pack import get_pack_metadata
+
+__all__ = [
+    'PACKS_PATH',
+    'get_installed_version',
+    'parse_installed_pack'
+]
+
+PACKS_PATH = '/opt/stackstorm/packs'
+
+
+def parse_installed_pack(installed_pack):
+    """
+    :return: ``(pack_name, pack_version)`` tuple, version is ``None`` when not specified.
+    """
+    pack_and_version = installed_pack.split(PACK_VERSION_SEPARATOR)
+    pack_name = pack_and_version[0]
+    pack_version = pack_and_version[1] if len(pack_and_version) > 1 else None
+    return pack_name, pack_version
+
+
+def get_installed_version(pack_name, packs_path=PACKS_PATH):
+    """
+    Get installed pack version from local pack metadata file.
+    """
+    pack_dir = os.path.join(packs_path, pack_name)
+    return get_pack_metadata(pack_dir=pack_dir).get('version', None)
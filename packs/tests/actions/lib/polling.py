@@ -0,0 +1,29 @@
+import time
+
+__all__ = [
+    'poll'
+]
+
+
+def poll(check, timeout, initial_interval=0.1, max_interval=2, backoff=2):
+    """
+    Call ``check`` until it returns a truthy value or ``timeout`` seconds have passed.
+
+    The wait between calls starts at ``initial_interval`` and is multiplied by ``backoff``
+    after every call, up to ``max_interval``.
+
+    :return: ``(value, waited, polls)`` tuple with the last value ``check`` returned.
+    """
+    start_time = time.time()
+    deadline = start_time + timeout
+    interval = initial_interval
+    polls = 0
+
+    while True:
+        polls += 1
+        value = check()
+        if value or time.time() >= deadline:
+            return value, time.time() - start_time, polls
+
+        time.sleep(max(0, min(interval, deadline - time.time())))
+        interval = min(interval * backoff, max_interval)
@@ -0,0 +1,116 @@
+import threading
+import time
+
+from six.moves import queue
+
+__all__ = [
+    'EXCLUSIVE',
+    'SUITE',
+    'run_scheduled'
+]
+
+# Holding this resource conflicts with every other test
+EXCLUSIVE = '*'
+
+# Shared state every test mutates or depends on not changing while it runs. Tests which share a
+# resource never run at the same time.
+SUITE = {
+    'test_quickstart': [],
+    'test_quickstart_key': ['datastore'],
+    'test_quickstart_rules': ['examples.sample_rule_with_webhook', 'webhook_sample.out'],
+    'test_quickstart_local_script_actions': [],
+    'test_quickstart_remote_script_actions': [],
+    'test_quickstart_python_actions': [],
+    'test_quickstart_trace': ['trace:test-trace-tag'],
+    'test_quickstart_polling_sensor': ['fixtures.test_trigger.dummy'],
+    'test_quickstart_passive_sensor': ['fixtures.test_passive_trigger.dummy'],
+    'test_render_config_context': [],
+    # Checks the latest key_value_pair trigger instances and the "a" key
+    'test_key_triggers': ['datastore', 'examples.sample_trigger'],
+    # Both respond to the latest inquiry
+    'test_inquiry_chain': ['inquiries'],
+    'test_inquiry_mistral': ['inquiries'],
+    # Checks the latest core.local executions
+    'test_timer_rule': [EXCLUSIVE],
+    # Registers all the packs, which resets rules other tests enable
+    'test_packs_pack': [EXCLUSIVE],
+    'test_pack_install_tool': ['packs:csv'],
+    'test_run_pack_tests_tool': ['packs:csv', 'packs:xml'],
+    'test_windows_runners': ['windows_host'],
+    'test_winrm_runners': ['windows_host'],
+    'test_winrm_large_script': ['windows_host']
+}
+
+
+def _conflicts(resources, held, running):
+    """
+    :param held: Resources of the running tests.
+    :param running: Running tests, an exclusive test can't start while any test runs, even one
+                    which holds no resources.
+    """
+    if not running:
+        return False
+    if EXCLUSIVE in resources or EXCLUSIVE in held:
+        return True
+    return bool(set(resources) & held)
+
+
+def run_scheduled(tests, run_test, parallelism, suite=None):
+    """
+    Run ``tests`` in order with up to ``parallelism`` tests at a time, never running two tests
+    which share a resource at the same time.
+
+    Tests which can't start yet are skipped over, except exclusive tests: no test after a
+    waiting exclusive test starts before it, so it can't be starved.
+
+    :param run_test: Called with the test name in a separate thread, its return value is the
+                     result of the test.
+    :return: ``{test: {'result': .., 'queued': .., 'duration': ..}}``.
+    """
+    suite = suite or SUITE
+    pending = list(tests)
+    running = {}
+    results = {}
+    done = queue.Queue()
+    start_time = time.time()
+
+    def run(name):
+        started = time.time()
+        try:
+            result = run_test(name)
+        except Exception as e:
+            result = e
+        done.put((name, result, started))
+
+    while pending or running:
+        held = set()
+        for name in running:
+            held.update(suite.get(name, []))
+
+        for name in list(pending):
+            if len(running) >= parallelism:
+                break
+
+            resources = suite.get(name, [])
+            if _conflicts(resources, held, running):
+                if EXCLUSIVE in resources:
+                    break
+                continue
+
+            pending.remove(name)
+            running[name] = time.time()
+            held.update(resources)
+
+            thread = threading.Thread(target=run, args=(name,))
+            thread.daemon = True
+            thread.start()
+
+        name, result, started = done.get()
+        del running[name]
+        results[name] = {
+            'result': result,
+            'queued': started - start_time,
+            'duration': time.time() - started
+        }
+
+    return results
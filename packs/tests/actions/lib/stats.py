@@ -0,0 +1,68 @@
+from __future__ import division
+
+import math
+
+__all__ = [
+    'HISTOGRAM_BUCKETS',
+    'histogram',
+    'percentile',
+    'summarize'
+]
+
+# Upper bounds (in seconds) of the latency histogram buckets
+HISTOGRAM_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return None
+
+    index = max(0, int(math.ceil(percent / 100.0 * len(values))) - 1)
+    return values[min(index, len(values) - 1)]
+
+
+def histogram(values, buckets=None):
+    """
+    Count values per bucket. Buckets are named after their upper bound ("<=0.1"), values above
+    the last bucket are counted under ">60".
+
+    :rtype: ``list`` of ``[bucket, count]`` pairs in bucket order.
+    """
+    buckets = buckets or HISTOGRAM_BUCKETS
+    counts = [0] * (len(buckets) + 1)
+    for value in values:
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+
+    names = ['<=%s' % (bound) for bound in buckets] + ['>%s' % (buckets[-1])]
+    return [[name, count] for name, count in zip(names, counts)]
+
+
+def summarize(values, buckets=None):
+    """
+    Summarize a list of latencies (in seconds) into count, min, max, mean, percentiles and a
+    histogram.
+
+    :rtype: ``dict``
+    """
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+
+    return {
+        'count': len(values),
+        'min': values[0],
+        'max': values[-1],
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'histogram': histogram(values, buckets)
+    }
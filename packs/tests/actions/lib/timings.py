@@ -0,0 +1,29 @@
+from lib.client import parse_timestamp
+
+__all__ = [
+    'task_timings'
+]
+
+
+def _status_time(execution, status):
+    for entry in getattr(execution, 'log', None) or []:
+        if entry.get('status') == status:
+            return parse_timestamp(entry['timestamp'])
+    return None
+
+
+def task_timings(execution):
+    """
+    Queue delay (requested until running) and run duration (running until finished) of an
+    execution. The start timestamp is set when the execution is requested, the time it started
+    running comes from the status log.
+    """
+    requested = parse_timestamp(execution.start_timestamp)
+    running = _status_time(execution, 'running')
+    end = getattr(execution, 'end_timestamp', None)
+    end = parse_timestamp(end) if end else None
+
+    return {
+        'queue_delay': running - requested if running else None,
+        'duration': end - running if end and running else None
+    }
@@ -0,0 +1,153 @@
+import time
+import uuid
+
+from st2client.models import Rule
+
+from st2common.runners.base_action import Action
+
+from lib.client import format_timestamp, get_client, parse_timestamp, query_all
+from lib.stats import summarize
+
+__all__ = [
+    'MeasureTimerAccuracyAction'
+]
+
+
+def timer_stats(fire_times, interval):
+    """
+    Drift, jitter and missed ticks of a single timer.
+
+    Jitter and drift are measured against the closest tick, so missed ticks don't count as
+    drift or jitter.
+
+    :param fire_times: Sorted fire times in epoch seconds.
+    """
+    def off_schedule(elapsed):
+        return elapsed - round(elapsed / float(interval)) * interval
+
+    deltas = [current - previous for previous, current in zip(fire_times, fire_times[1:])]
+    return {
+        'ticks': len(fire_times),
+        'drift': off_schedule(fire_times[-1] - fire_times[0]),
+        'jitter': [abs(off_schedule(delta)) for delta in deltas],
+        'missed': sum(max(0, int(round(delta / float(interval))) - 1) for delta in deltas)
+    }
+
+
+class MeasureTimerAccuracyAction(Action):
+    def run(self, interval, duration, timers, distinct_intervals, action, settle_time, cleanup,
+            token=None, protocol='http', hostname='127.0.0.1'):
+        """
+        Enable ``timers`` interval timer rules for ``duration`` seconds and measure how
+        precisely they fire.
+
+        st2 shares one timer between all the rules with the same trigger parameters. Rule N
+        fires every ``interval + N % distinct_intervals`` seconds, so the rules are spread over
+        up to ``distinct_intervals`` timers. The intervals stay bounded, so results for different
+        numbers of rules are comparable. With ``distinct_intervals=1`` the result measures fan-out
+        of one timer to ``timers`` rules.
+        """
+        client = get_client(token, protocol, hostname)
+        run_id = uuid.uuid4().hex[:8]
+
+        rules = []
+        try:
+            start_time = time.time()
+            for index in range(timers):
+                delta = interval + index % max(distinct_intervals, 1)
+                rules.append(client.rules.create(Rule(
+                    name='timer_accuracy_%s_%d' % (run_id, index),
+                    pack='tests',
+                    description='Interval timer accuracy measurement.',
+                    trigger={
+                        'type': 'core.st2.IntervalTimer',
+                        'parameters': {'delta': delta, 'unit': 'seconds'}
+                    },
+                    criteria={},
+                    action={'ref': action, 'parameters': {}},
+                    enabled=True)))
+
+            time.sleep(duration)
+
+            for rule in rules:
+                rule.enabled = False
+                client.rules.update(rule)
+            end_time = time.time()
+
+            # Let executions of the last ticks start
+            time.sleep(settle_time)
+
+            return self._collect(client, rules, duration, action, start_time, end_time)
+        finally:
+            if cleanup:
+                for rule in rules:
+                    client.rules.delete(rule)
+
+    def _collect(self, client, rules, duration, action, start_time, end_time):
+        executions = query_all(client.executions, action=action,
+                               timestamp_gt=format_timestamp(start_time))
+        execution_starts = {}
+        for execution in executions:
+            trigger_instance = getattr(execution, 'trigger_instance', None) or {}
+            if trigger_instance.get('id'):
+                execution_starts[trigger_instance['id']] = parse_timestamp(
+                    execution.start_timestamp)
+
+        # Rules with the same parameters share a trigger (and timer), measure every timer once
+        intervals = {}
+        rule_counts = {}
+        for rule in rules:
+            intervals[rule.trigger['ref']] = rule.trigger['parameters']['delta']
+            rule_counts[rule.trigger['ref']] = rule_counts.get(rule.trigger['ref'], 0) + 1
+
+        jitter = []
+        drift = []
+        execution_lag = []
+        ticks = 0
+        missed = 0
+        expected_ticks = 0
+        coverage = {}
+        for trigger_ref, interval in sorted(intervals.items(), key=lambda item: item[1]):
+            expected_ticks += int(duration // interval)
+            coverage[str(interval)] = {
+                'rules': rule_counts[trigger_ref],
+                'expected_ticks': int(duration // interval),
+                'ticks': 0
+            }
+            instances = query_all(client.triggerinstances, trigger=trigger_ref,
+                                  timestamp_gt=format_timestamp(start_time),
+                                  timestamp_lt=format_timestamp(end_time))
+            fire_times = {}
+            for instance in instances:
+                fire_times[instance.id] = parse_timestamp(instance.occurrence_time)
+                if instance.id in execution_starts:
+                    execution_lag.append(execution_starts[instance.id] - fire_times[instance.id])
+
+            if not fire_times:
+                missed += int(duration // interval)
+                continue
+
+            stats = timer_stats(sorted(fire_times.values()), interval)
+            coverage[str(interval)]['ticks'] = stats['ticks']
+            ticks += stats['ticks']
+            missed += stats['missed']
+            drift.append(abs(stats['drift']))
+            jitter.extend(stats['jitter'])
+
+        # Share of the expected ticks which fired, per interval
+        for interval_coverage in coverage.values():
+            expected = interval_coverage['expected_ticks']
+            interval_coverage['coverage'] = (float(interval_coverage['ticks']) / expected
+                                             if expected else None)
+
+        return {
+            'rules': len(rules),
+            'timers': len(intervals),
+            'expected_ticks': expected_ticks,
+            'ticks': ticks,
+            'missed_ticks': missed,
+            'intervals': coverage,
+            'jitter': summarize(jitter),
+            'drift': summarize(drift),
+            'execution_lag': summarize(execution_lag)
+        }
@@ -0,0 +1,75 @@
+import time
+
+from st2client.models import Execution
+
+from st2common.runners.base_action import Action
+
+from lib.client import get_client
+from lib.polling import poll
+from lib.scheduler import run_scheduled
+
+__all__ = [
+    'RunTestsAction'
+]
+
+FINISHED_STATUSES = ['succeeded', 'failed', 'timeout', 'canceled', 'abandoned']
+
+
+class RunTestsAction(Action):
+    def run(self, tests, parallelism, test_timeout, test_parameters=None, token=None,
+            protocol='http', hostname='127.0.0.1'):
+        """
+        Run the test chains of this pack concurrently, except for tests which share state.
+        """
+        client = get_client(token, protocol, hostname)
+        test_parameters = test_parameters or {}
+
+        def run_test(name):
+            parameters = {'token': token, 'protocol': protocol, 'hostname': hostname}
+            parameters.update(test_parameters.get(name, {}))
+            execution = client.executions.create(Execution(action='tests.%s' % (name),
+                                                           parameters=parameters))
+
+            def finished():
+                current = client.executions.get_by_id(execution.id)
+                return current if current.status in FINISHED_STATUSES else None
+
+            finished_execution, _, _ = poll(finished, test_timeout, initial_interval=1,
+                                            max_interval=5)
+            if finished_execution:
+                return {
+                    'execution_id': execution.id,
+                    'status': finished_execution.status
+                }
+
+            # The test's resources are released once this returns, so make sure it stops
+            # before a conflicting test starts
+            client.executions.delete(execution)
+            canceled_execution, _, _ = poll(finished, test_timeout, initial_interval=1,
+                                            max_interval=5)
+            return {
+                'execution_id': execution.id,
+                'status': 'timed out' if canceled_execution else 'not finished'
+            }
+
+        start_time = time.time()
+        results = run_scheduled(tests, run_test, parallelism)
+        duration = time.time() - start_time
+
+        report = []
+        for name in tests:
+            result = results[name]
+            if isinstance(result['result'], Exception):
+                result['result'] = {'status': 'error', 'error': str(result['result'])}
+            report.append(dict(result['result'], test=name, queued=result['queued'],
+                               duration=result['duration']))
+
+        print('%-45s %-13s %10s %10s' % ('TEST', 'STATUS', 'QUEUED', 'DURATION'))
+        for item in report:
+            print('%-45s %-13s %9.1fs %9.1fs' % (item['test'], item['status'], item['queued'],
+                                                 item['duration']))
+        print('Total %.1fs, %.1fs when run one at a time.' % (
+            duration, sum(item['duration'] for item in report)))
+
+        succeeded = all(item['status'] == 'succeeded' for item in report)
+        return succeeded, {'duration': duration, 'tests': report}
@@ -0,0 +1,118 @@
+import time
+
+from st2client.models import Execution, KeyValuePair
+
+from st2common.runners.base_action import Action
+
+from lib.client import get_client
+
+__all__ = [
+    'St2ApiAction'
+]
+
+PENDING_STATUSES = ['requested', 'scheduled', 'delayed', 'running', 'canceling', 'pausing']
+
+# Wait between polls of a running execution, doubled after every poll up to the maximum
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 2
+
+
+def _serialize(resource):
+    return resource.serialize() if resource is not None else None
+
+
+class St2ApiAction(Action):
+    """
+    Common st2 CLI operations through the API, so test chain steps don't need a shell and a
+    CLI process each.
+
+    Get and list operations fail when nothing is found, like the ``st2 ... | grep`` steps they
+    replace.
+    """
+
+    def run(self, operation, token=None, protocol='http', hostname='127.0.0.1', **kwargs):
+        self.client = get_client(token, protocol, hostname)
+        return getattr(self, '_%s' % (operation))(**kwargs)
+
+    def _run(self, ref, parameters=None, trace_tag=None, trace_id=None, wait=True, **kwargs):
+        execution = Execution(action=ref, parameters=parameters or {})
+        if trace_id:
+            execution.context = {'trace_context': {'id_': trace_id}}
+        elif trace_tag:
+            execution.context = {'trace_context': {'trace_tag': trace_tag}}
+
+        execution = self.client.executions.create(execution)
+        if not wait:
+            return True, _serialize(execution)
+
+        # Bounded by the timeout of this action
+        interval = MIN_POLL_INTERVAL
+        while execution.status in PENDING_STATUSES:
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+            execution = self.client.executions.get_by_id(execution.id)
+
+        return execution.status == 'succeeded', _serialize(execution)
+
+    def _execution_get(self, id, **kwargs):
+        return self._get(self.client.executions, id)
+
+    def _execution_list(self, ref=None, limit=1, **kwargs):
+        filters = {'action': ref} if ref else {}
+        return self._list(self.client.executions, limit, **filters)
+
+    def _trigger_get(self, ref, **kwargs):
+        return self._get(self.client.managers['TriggerType'], ref)
+
+    def _trigger_instance_get(self, id, **kwargs):
+        return self._get(self.client.triggerinstances, id)
+
+    def _trigger_instance_list(self, trigger, limit=1, **kwargs):
+        return self._list(self.client.triggerinstances, limit, trigger=trigger)
+
+    def _trace_get(self, id, **kwargs):
+        return self._get(self.client.managers['Trace'], id)
+
+    def _trace_list(self, trace_tag=None, execution=None, limit=1, **kwargs):
+        filters = {}
+        if trace_tag:
+            filters['trace_tag'] = trace_tag
+        if execution:
+            filters['execution'] = execution
+        return self._list(self.client.managers['Trace'], limit, **filters)
+
+    def _key_get(self, name, scope='st2kv.system', **kwargs):
+        # Returns an empty list instead of None when the key doesn't exist
+        key = self.client.keys.get_by_name(name, scope=scope)
+        return bool(key), _serialize(key or None)
+
+    def _key_set(self, name, value, scope='st2kv.system', **kwargs):
+        key = KeyValuePair(id=name, name=name, value=value, scope=scope)
+        return True, _serialize(self.client.keys.update(key))
+
+    def _key_delete(self, name, scope='st2kv.system', **kwargs):
+        key = KeyValuePair(id=name, name=name, scope=scope)
+        return self.client.keys.delete(key, params={'scope': scope}), None
+
+    def _rule_enable(self, ref, **kwargs):
+        return self._set_rule_enabled(ref, True)
+
+    def _rule_disable(self, ref, **kwargs):
+        return self._set_rule_enabled(ref, False)
+
+    def _set_rule_enabled(self, ref, enabled):
+        rule = self.client.rules.get_by_ref_or_id(ref)
+        if rule is None:
+            return False, None
+
+        rule.enabled = enabled
+        return True, _serialize(self.client.rules.update(rule))
+
+    def _get(self, manager, ref_or_id):
+        resource = manager.get_by_ref_or_id(ref_or_id)
+        return resource is not None, _serialize(resource)
+
+    def _list(self, manager, limit, **filters):
+        resources = manager.query(limit=limit, **filters) if filters else \
+            manager.get_all(limit=limit)
+        return bool(resources), [_serialize(resource) for resource in resources]
@@ -0,0 +1,181 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from st2client.models import Execution
+
+from st2common.runners.base_action import Action
+
+from lib.client import get_client
+from lib.polling import poll
+from lib.timings import task_timings
+
+__all__ = [
+    'TimePackInstallAction'
+]
+
+FINISHED_STATUSES = ['succeeded', 'failed', 'timeout', 'canceled', 'abandoned']
+WORKFLOW_RUNNERS = ['action-chain', 'orquesta', 'mistral-v2']
+
+# Phase of every action run by the packs.install workflow, other actions are counted as "other"
+PHASES = {
+    'packs.download': 'download',
+    'packs.get_pack_dependencies': 'dependency_resolution',
+    'packs.setup_virtualenv': 'virtualenv',
+    'packs.load': 'registration'
+}
+
+
+def run_timed(command, env=None, cwd=None):
+    """
+    :return: ``(succeeded, elapsed)`` tuple.
+    """
+    start_time = time.time()
+    with open(os.devnull, 'w') as devnull:
+        exit_code = subprocess.call(command, env=env, cwd=cwd, stdout=devnull, stderr=devnull)
+    return exit_code == 0, time.time() - start_time
+
+
+def phase_timings(children):
+    """
+    Sum the run time of the actions in every install phase.
+    """
+    phases = {}
+    for child in children:
+        if child.runner['name'] in WORKFLOW_RUNNERS:
+            continue
+
+        phase = PHASES.get(child.action['ref'], 'other')
+        duration = task_timings(child)['duration'] or 0
+        phases[phase] = phases.get(phase, 0) + duration
+
+    return phases
+
+
+class TimePackInstallAction(Action):
+    def run(self, packs, mirror_path, rounds, install_timeout, measure_virtualenv,
+            virtualenv_binary, packs_path, work_dir, token=None, protocol='http',
+            hostname='127.0.0.1'):
+        """
+        Install ``packs`` from git repositories under ``mirror_path`` ``rounds`` times and
+        report the time spent in every phase of ``packs.install``.
+
+        ``packs.setup_virtualenv`` creates the virtualenv and installs the requirements in one
+        action, so with ``measure_virtualenv`` both steps are also timed separately for every
+        installed pack, once with empty (cold) and once with populated (warm) pip and virtualenv
+        caches.
+        """
+        client = get_client(token, protocol, hostname)
+        pack_urls = ['file://%s' % (os.path.join(mirror_path, pack)) for pack in packs]
+
+        installs = []
+        for install_round in range(rounds):
+            # Remove the packs, so every round downloads and sets up the packs from scratch
+            uninstall = self._run_action(client, 'packs.uninstall', {'packs': packs},
+                                         install_timeout)
+            if uninstall.status != 'succeeded':
+                print('Round %d: packs.uninstall %s, not installing.' % (install_round + 1,
+                                                                        uninstall.status))
+                installs.append({
+                    'round': install_round + 1,
+                    'uninstall_execution_id': uninstall.id,
+                    'uninstall_status': uninstall.status,
+                    'status': 'uninstall %s' % (uninstall.status),
+                    'duration': None,
+                    'phases': {}
+                })
+                continue
+
+            execution = self._run_action(client, 'packs.install',
+                                         {'packs': pack_urls, 'force': True}, install_timeout)
+            children = client.executions.get_property(execution.id, 'children', depth=-1)
+            installs.append({
+                'round': install_round + 1,
+                'uninstall_execution_id': uninstall.id,
+                'uninstall_status': uninstall.status,
+                'execution_id': execution.id,
+                'status': execution.status,
+                'duration': task_timings(execution)['duration'],
+                'phases': phase_timings(children)
+            })
+
+        report = {
+            'packs': packs,
+            'installs': installs
+        }
+        if measure_virtualenv:
+            report['virtualenv'] = dict(
+                (pack, self._time_virtualenv(os.path.join(packs_path, pack), virtualenv_binary,
+                                             work_dir))
+                for pack in packs)
+
+        print('%6s %-18s %10s %10s %10s %10s %10s' % (
+            'ROUND', 'STATUS', 'TOTAL', 'DOWNLOAD', 'DEPS', 'VENV', 'REGISTER'))
+        for install in installs:
+            phases = install['phases']
+            print('%6d %-18s %10s %10s %10s %10s %10s' % (
+                install['round'], install['status'], _seconds(install['duration']),
+                _seconds(phases.get('download')), _seconds(phases.get('dependency_resolution')),
+                _seconds(phases.get('virtualenv')), _seconds(phases.get('registration'))))
+
+        for pack, timings in sorted(report.get('virtualenv', {}).items()):
+            for cache in ['cold', 'warm']:
+                print('%s (%s caches): virtualenv %s, pip install %s' % (
+                    pack, cache, _seconds(timings[cache]['virtualenv']),
+                    _seconds(timings[cache]['pip_install'])))
+
+        success = all(install['status'] == 'succeeded' for install in installs)
+        return success, report
+
+    def _run_action(self, client, ref, parameters, timeout):
+        execution = client.executions.create(Execution(action=ref, parameters=parameters))
+
+        def finished():
+            current = client.executions.get_by_id(execution.id)
+            return current if current.status in FINISHED_STATUSES else None
+
+        finished_execution, _, _ = poll(finished, timeout, initial_interval=1, max_interval=5)
+        if not finished_execution:
+            raise Exception('%s did not finish within %d seconds.' % (ref, timeout))
+        return finished_execution
+
+    def _time_virtualenv(self, pack_path, virtualenv_binary, work_dir):
+        """
+        Create a virtualenv for the pack and install its requirements twice, the first time
+        with empty caches, the second time with the caches the first run populated.
+        """
+        if not os.path.isdir(work_dir):
+            os.makedirs(work_dir)
+        cache_dir = tempfile.mkdtemp(dir=work_dir)
+        env = dict(os.environ,
+                   PIP_CACHE_DIR=os.path.join(cache_dir, 'pip'),
+                   VIRTUALENV_OVERRIDE_APP_DATA=os.path.join(cache_dir, 'virtualenv'))
+        requirements = os.path.join(pack_path, 'requirements.txt')
+        virtualenv_path = os.path.join(cache_dir, 'venv')
+
+        timings = {}
+        try:
+            for cache in ['cold', 'warm']:
+                shutil.rmtree(virtualenv_path, ignore_errors=True)
+                created, virtualenv_time = run_timed([virtualenv_binary, virtualenv_path],
+                                                     env=env)
+                timing = {
+                    'virtualenv': virtualenv_time if created else None,
+                    'pip_install': None
+                }
+                if created and os.path.isfile(requirements):
+                    pip = os.path.join(virtualenv_path, 'bin', 'pip')
+                    installed, pip_time = run_timed([pip, 'install', '-r', requirements],
+                                                    env=env)
+                    timing['pip_install'] = pip_time if installed else None
+                timings[cache] = timing
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        return timings
+
+
+def _seconds(value):
+    return '%.1fs' % (value) if value is not None else '-'
@@ -0,0 +1,93 @@
+from multiprocessing.pool import ThreadPool
+
+from st2common.runners.base_action import Action
+
+from lib.client import get_client, parse_timestamp, query_all
+from lib.stats import summarize
+
+__all__ = [
+    'TraceSensorLatencyAction'
+]
+
+
+class TraceSensorLatencyAction(Action):
+    def run(self, trigger, run_id=None, limit=1000, concurrency=10, token=None,
+            protocol='http', hostname='127.0.0.1'):
+        """
+        Trace trigger instances dispatched by the fixture sensors, which stamp every payload
+        with ``trace.run``, ``trace.seq`` and ``trace.sent_at``.
+
+        :param run_id: Sensor run to trace, defaults to the run of the latest trigger instance.
+        :param limit: Maximum number of (latest) trigger instances to trace.
+        """
+        client = get_client(token, protocol, hostname)
+
+        instances = self._get_trigger_instances(client, trigger, limit)
+        if not instances:
+            print('No traced trigger instances of "%s" found.' % (trigger))
+            return False, {}
+
+        run_id = run_id or instances[0].payload['trace']['run']
+        instances = [instance for instance in instances
+                     if instance.payload['trace']['run'] == run_id]
+
+        pool = ThreadPool(concurrency)
+        traces = pool.map(lambda instance: self._trace(client, instance), instances)
+        pool.close()
+        pool.join()
+
+        latencies = {
+            'dispatch_to_trigger_instance': [],
+            'trigger_instance_to_enforcement': [],
+            'enforcement_to_execution_start': [],
+            'dispatch_to_execution_start': []
+        }
+        for trace in traces:
+            for name, latency in trace['latencies'].items():
+                latencies[name].append(latency)
+
+        sequence = set(trace['seq'] for trace in traces)
+        first, last = min(sequence), max(sequence)
+        dropped = sorted(set(range(first, last + 1)) - sequence)
+
+        result = {
+            'run_id': run_id,
+            'trigger_instances': len(traces),
+            'first_seq': first,
+            'last_seq': last,
+            'dropped': dropped,
+            'latency': dict((name, summarize(values)) for name, values in latencies.items())
+        }
+        return not dropped, result
+
+    def _get_trigger_instances(self, client, trigger, limit):
+        instances = query_all(client.triggerinstances, limit=limit, trigger=trigger)
+        return [instance for instance in instances
+                if isinstance(instance.payload, dict) and 'trace' in instance.payload]
+
+    def _trace(self, client, instance):
+        sent_at = instance.payload['trace']['sent_at']
+        ingested_at = parse_timestamp(instance.occurrence_time)
+        latencies = {
+            'dispatch_to_trigger_instance': ingested_at - sent_at
+        }
+
+        # Only set when a rule matched the trigger instance. With several matching rules, the
+        # first enforcement is traced.
+        enforcements = client.ruleenforcements.query(trigger_instance=instance.id)
+        if enforcements:
+            enforcement = enforcements[0]
+            enforced_at = parse_timestamp(enforcement.enforced_at)
+            latencies['trigger_instance_to_enforcement'] = enforced_at - ingested_at
+
+            execution_id = getattr(enforcement, 'execution_id', None)
+            execution = client.executions.get_by_id(execution_id) if execution_id else None
+            if execution is not None:
+                started_at = parse_timestamp(execution.start_timestamp)
+                latencies['enforcement_to_execution_start'] = started_at - enforced_at
+                latencies['dispatch_to_execution_start'] = started_at - sent_at
+
+        return {
+            'seq': instance.payload['trace']['seq'],
+            'latencies': latencies
+        }
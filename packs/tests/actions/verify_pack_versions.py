@@ -0,0 +1,84 @@
+import os
+import time
+from multiprocessing.pool import ThreadPool
+
+from st2common.runners.base_action import Action
+
+from lib.pack_index import DEFAULT_CACHE_DIR, load_index
+from lib.packs import PACKS_PATH, get_installed_version
+
+__all__ = [
+    'VerifyPackVersionsAction'
+]
+
+
+def list_pack_dirs(packs_path):
+    return sorted(name for name in os.listdir(packs_path)
+                  if os.path.isdir(os.path.join(packs_path, name)) and not name.startswith('.'))
+
+
+class VerifyPackVersionsAction(Action):
+    def run(self, packs_path=PACKS_PATH, exclude=None, concurrency=16, index_url=None,
+            index_file=None, cache_dir=DEFAULT_CACHE_DIR, cache_ttl=300, **kwargs):
+        """
+        Compare the version of every pack installed under ``packs_path`` to a single snapshot
+        of the index.
+
+        :param exclude: Packs to skip, e.g. the packs which ship with st2 and aren't in the index.
+        """
+        start_time = time.time()
+        index, sources = load_index([index_url] if index_url else None, index_file=index_file,
+                                    cache_dir=cache_dir, ttl=cache_ttl)
+        index_time = time.time() - start_time
+
+        exclude = set(exclude or [])
+        pack_names = [name for name in list_pack_dirs(packs_path) if name not in exclude]
+
+        def check(pack_name):
+            try:
+                return pack_name, get_installed_version(pack_name, packs_path=packs_path), None
+            except Exception as e:
+                return pack_name, None, str(e)
+
+        pool = ThreadPool(concurrency)
+        try:
+            results = pool.map(check, pack_names)
+        finally:
+            pool.close()
+            pool.join()
+
+        report = {
+            'index_sources': sources,
+            'checked': len(results),
+            'matching': [],
+            'mismatches': {},
+            'not_in_index': [],
+            'parse_errors': {},
+            'index_time': index_time,
+            'duration': time.time() - start_time
+        }
+        for pack_name, installed_version, error in results:
+            if error:
+                report['parse_errors'][pack_name] = error
+            elif pack_name not in index:
+                report['not_in_index'].append(pack_name)
+            elif index[pack_name].get('version') != installed_version:
+                report['mismatches'][pack_name] = {
+                    'installed_version': installed_version,
+                    'index_version': index[pack_name].get('version')
+                }
+            else:
+                report['matching'].append(pack_name)
+
+        for pack_name, versions in sorted(report['mismatches'].items()):
+            print('%s: installed %s, index %s' % (pack_name, versions['installed_version'],
+                                                  versions['index_version']))
+        for pack_name in report['not_in_index']:
+            print('%s: not in the index' % (pack_name))
+        for pack_name, error in sorted(report['parse_errors'].items()):
+            print('%s: %s' % (pack_name, error))
+        print('Checked %d packs in %.2fs (%.2fs loading the index).' % (
+            report['checked'], report['duration'], report['index_time']))
+
+        success = not (report['mismatches'] or report['not_in_index'] or report['parse_errors'])
+        return success, report
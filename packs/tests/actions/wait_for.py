@@ -0,0 +1,75 @@
+import time
+
+from st2common.runners.base_action import Action
+
+from lib.client import format_timestamp, get_client, parse_timestamp
+from lib.polling import poll
+
+__all__ = [
+    'WaitForAction'
+]
+
+
+def _to_epoch(value):
+    try:
+        return float(value)
+    except ValueError:
+        return parse_timestamp(value)
+
+
+def _contains(payload, expected):
+    return isinstance(payload, dict) and \
+        all(payload.get(key) == value for key, value in expected.items())
+
+
+class WaitForAction(Action):
+    """
+    Poll a condition until it holds or the deadline passes, instead of sleeping a fixed time.
+    """
+
+    def run(self, condition, max_wait, initial_interval, max_interval, since=None, token=None,
+            protocol='http', hostname='127.0.0.1', **kwargs):
+        """
+        :param since: Only traces and trigger instances created after this (API timestamp or
+                      epoch seconds) count, defaults to the start of this action.
+        """
+        self.client = get_client(token, protocol, hostname)
+        kwargs['since'] = _to_epoch(since) if since else time.time()
+        check = getattr(self, '_%s' % (condition))
+
+        value, waited, polls = poll(lambda: check(**kwargs), max_wait,
+                                    initial_interval=initial_interval,
+                                    max_interval=max_interval)
+
+        if not value:
+            print('Condition "%s" didn\'t hold after %.2fs.' % (condition, waited))
+        return bool(value), {
+            'waited': waited,
+            'polls': polls,
+            'result': value.serialize() if value else None
+        }
+
+    def _execution_status(self, id, statuses, **kwargs):
+        execution = self.client.executions.get_by_id(id)
+        return execution if execution and execution.status in statuses else None
+
+    def _trace(self, trace_tag, since, count=1, **kwargs):
+        # Traces can't be filtered by time, so check the latest few
+        for trace in self.client.managers['Trace'].query(trace_tag=trace_tag, limit=10):
+            if parse_timestamp(trace.start_timestamp) < since:
+                continue
+            if len(getattr(trace, 'action_executions', [])) >= count:
+                return trace
+        return None
+
+    def _inquiry(self, id, **kwargs):
+        # Only pending inquiries can be retrieved
+        return self.client.managers['Inquiry'].get_by_id(id)
+
+    def _trigger_instance(self, trigger, since, payload=None, **kwargs):
+        instances = self.client.triggerinstances.query(trigger=trigger, limit=10,
+                                                       timestamp_gt=format_timestamp(since))
+        for instance in instances:
+            if _contains(instance.payload, payload or {}):
+                return instance
+        return None